@@ -125,6 +125,8 @@ class AppFluentWindow(FluentWindow, Base):
         if not message_box.exec():
             event.ignore()
         else:
+            # SIGTERM 直接结束进程，先写入尚在延迟期内的配置修改
+            Config.flush_pending()
             os.kill(os.getpid(), signal.SIGTERM)
 
     # 响应显示 Toast 事件
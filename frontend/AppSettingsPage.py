@@ -24,7 +24,7 @@ class AppSettingsPage(QWidget, Base):
         self.setObjectName(text.replace(" ", "-"))
 
         # 载入并保存默认配置
-        config = Config().load().save()
+        config = Config().load().ensure_saved_once()
 
         # 设置主容器
         self.root = QVBoxLayout(self)
@@ -31,7 +31,7 @@ class ModelListPage(MessageBoxBase, Base):
         self.models: list[str] = None
 
         # 载入并保存默认配置
-        config = Config().load().save()
+        config = Config().load().ensure_saved_once()
 
         # 设置框体
         self.widget.setFixedSize(960, 720)
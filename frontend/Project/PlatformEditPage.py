@@ -27,7 +27,7 @@ class PlatformEditPage(MessageBoxBase, Base):
         super().__init__(window)
 
         # 载入并保存默认配置
-        config = Config().load().save()
+        config = Config().load().ensure_saved_once()
 
         # 设置框体
         self.widget.setFixedSize(960, 720)
@@ -76,7 +76,10 @@ class GlossaryTranslateWorker(QThread):
             self.progress.emit("正在翻译术语库...", 0)
             translator = FastTranslator(engine=self.engine)
             srcs = [src for _, src in self.tasks]
-            translated = translator.translate_batch(srcs, target_lang=self.target_lang, source_lang=self.source_lang)
+            try:
+                translated = translator.translate_batch(srcs, target_lang=self.target_lang, source_lang=self.source_lang)
+            finally:
+                translator.close()
 
             results: List[tuple[int, str]] = []
             for idx, (row, _) in enumerate(self.tasks):
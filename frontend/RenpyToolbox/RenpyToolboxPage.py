@@ -157,7 +157,6 @@ class RenpyToolboxPage(Base, QWidget):
         """检查是否有未完成的翻译任务"""
         try:
             from module.Config import Config
-            from pathlib import Path
             import os
             
             config = Config().load()
@@ -166,19 +165,12 @@ class RenpyToolboxPage(Base, QWidget):
             if not output_folder or not os.path.isdir(output_folder):
                 return False
             
-            # 检查缓存目录是否存在
-            cache_dir = Path(output_folder) / "cache"
-            items_file = cache_dir / "items.json"
-            
-            if items_file.exists():
-                import json
-                with open(items_file, "r", encoding="utf-8") as f:
-                    items = json.load(f)
-                    # 检查是否有未翻译的条目
-                    untranslated = sum(1 for item in items if item.get("status", 0) == 0)
-                    if untranslated > 0:
-                        return True
-            return False
+            # 通过缓存管理器读取（兼容 items.jsonl / 旧版 items.json 与增量日志）
+            from module.Cache.CacheManager import CacheManager
+            cache_manager = CacheManager(service=False)
+            cache_manager.load_items_from_file(output_folder)
+            # 检查是否有未翻译的条目
+            return cache_manager.get_item_count_by_status(Base.TranslationStatus.UNTRANSLATED) > 0
         except Exception:
             return False
 
@@ -3,15 +3,21 @@
 管理不需要翻译的文本（如专有名词、代码片段等），这些内容将在翻译过程中保持原文。
 """
 
-from typing import List, Dict
-
+import concurrent.futures
+import dataclasses
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import List, Dict, Set
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QFileDialog,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
 )
@@ -32,11 +38,209 @@ from base.Base import Base
 from module.Config import Config
 from base.LogManager import LogManager
 
+# 优先使用编译加速、API 兼容 openpyxl 的 fastpyxl，未安装时回退到 openpyxl
 try:
-    from openpyxl import load_workbook, Workbook
+    from fastpyxl import load_workbook, Workbook
 except ImportError:
-    load_workbook = None
-    Workbook = None
+    try:
+        from openpyxl import load_workbook, Workbook
+    except ImportError:
+        load_workbook = None
+        Workbook = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# 正则匹配 [variable_name]：先在字节上粗筛（\x80-\xff 覆盖 UTF-8 多字节字符，如 [名前]），
+# 命中的少量片段解码后再用 str 模式确认变量名由 Unicode 单词字符组成
+_RE_VARIABLE_BYTES = re.compile(rb"\[((?:\w|[\x80-\xff])+)\]")
+_RE_VARIABLE = re.compile(r"\[(\w+)\]")
+
+
+def _scan_rpy_variables(path: str) -> Set[bytes]:
+    """以 mmap 方式扫描单个 .rpy 文件，返回其中的 [variable] 候选片段（bytes，由调用方解码确认）"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 先用 C 层的 find 定位首个 "["，不含方括号的文件直接跳过，否则从该位置开始匹配
+            start = mm.find(b"[")
+            if start < 0:
+                return set()
+            return {m.group(0) for m in _RE_VARIABLE_BYTES.finditer(mm, start)}
+
+
+class VariableScanWorker(QThread):
+    """后台扫描 [variable] 引用的工作线程"""
+    finished = pyqtSignal(bool, object)  # 成功, 变量集合或错误信息
+
+    def __init__(self, game_path: str):
+        super().__init__()
+        self.game_path = game_path
+
+    def run(self):
+        try:
+            paths = [
+                os.path.join(dirpath, name)
+                for dirpath, _, filenames in os.walk(self.game_path)
+                for name in filenames
+                if name.endswith(".rpy")
+            ]
+            found_bytes: Set[bytes] = set()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+                for result in executor.map(self._scan_one, paths):
+                    found_bytes |= result
+            found = {text for raw in found_bytes if _RE_VARIABLE.fullmatch(text := raw.decode("utf-8", errors="ignore"))}
+            self.finished.emit(True, found)
+        except Exception as e:
+            LogManager.get().error(f"扫描变量失败: {e}")
+            self.finished.emit(False, str(e))
+
+    @staticmethod
+    def _scan_one(path: str) -> Set[bytes]:
+        try:
+            return _scan_rpy_variables(path)
+        except (OSError, ValueError):
+            return set()
+
+
+# 去重比较时忽略的首尾引号
+_SRC_QUOTE_CHARS = "\"'“”‘’"
+
+
+# Excel 表头别名 -> 字段名（小写，模块加载时一次性构建）
+_HEADER_ALIAS_TO_KEY: Dict[str, str] = {
+    alias.lower(): key
+    for key, aliases in {
+        "src": ("原文", "原始文本", "source", "src", "text"),
+        "comment": ("备注", "说明", "comment", "note", "备注信息"),
+    }.items()
+    for alias in aliases
+}
+
+
+# 表格样式表（模块级常量，主题切换时复用同一字符串对象）
+_DARK_TABLE_QSS = """
+    QTableView {
+        background-color: rgb(39, 39, 39);
+        color: rgb(200, 200, 200);
+        border: 1px solid rgb(55, 55, 55);
+        border-radius: 4px;
+        gridline-color: rgb(55, 55, 55);
+    }
+    QTableView::item {
+        padding: 6px;
+    }
+    QTableView::item:selected {
+        background-color: rgb(70, 70, 70);
+        color: rgb(255, 255, 255);
+    }
+    QHeaderView::section {
+        background-color: rgb(50, 50, 50);
+        color: rgb(200, 200, 200);
+        padding: 8px;
+        border: none;
+        border-bottom: 1px solid rgb(65, 65, 65);
+        font-weight: bold;
+    }
+"""
+
+_LIGHT_TABLE_QSS = """
+    QTableView {
+        background-color: rgb(255, 255, 255);
+        color: rgb(32, 32, 32);
+        border: 1px solid rgb(220, 220, 220);
+        border-radius: 4px;
+        gridline-color: rgb(230, 230, 230);
+    }
+    QTableView::item {
+        padding: 6px;
+    }
+    QTableView::item:selected {
+        background-color: rgb(210, 210, 210);
+        color: rgb(0, 0, 0);
+    }
+    QHeaderView::section {
+        background-color: rgb(245, 245, 245);
+        color: rgb(32, 32, 32);
+        padding: 8px;
+        border: none;
+        border-bottom: 1px solid rgb(220, 220, 220);
+        font-weight: bold;
+    }
+"""
+
+
+@dataclasses.dataclass(slots=True)
+class PreserveEntry:
+    """保留文本条目（slots，比 dict 更省内存，属性访问更快）"""
+
+    src: str = ""
+    comment: str = ""
+
+
+class PreserveTableModel(QAbstractTableModel):
+    """保留文本表格模型：直接持有 list[PreserveEntry]，避免逐单元格创建 QTableWidgetItem"""
+
+    KEYS = ("src", "comment")
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows: List[PreserveEntry] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.KEYS)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return getattr(self._rows[index.row()], self.KEYS[index.column()])
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        setattr(self._rows[index.row()], self.KEYS[index.column()], "" if value is None else str(value))
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def rows(self) -> List[PreserveEntry]:
+        return self._rows
+
+    def set_rows(self, rows: List[PreserveEntry]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def append_row(self, item: PreserveEntry) -> int:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(item)
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int) -> None:
+        if not 0 <= row < len(self._rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
 
 
 class TextPreservePage(Base, QWidget):
@@ -50,11 +254,14 @@ class TextPreservePage(Base, QWidget):
         self.setObjectName(object_name)
         self.setProperty("toolboxPage", True)
 
-        self.config = Config().load()
+        # 配置延迟到首次事件循环再读取，页面构造不等待磁盘 IO
+        self.config = None
+        self._config_mtime = None
         self.logger = LogManager.get()
+        self.scan_worker = None
 
         self._init_ui()
-        self._load_from_config()
+        QTimer.singleShot(0, self._load_from_config)
 
         # 监听主题变化以更新表格配色
         qconfig.themeChanged.connect(self._on_theme_changed)
@@ -148,13 +355,19 @@ class TextPreservePage(Base, QWidget):
         table_label = StrongBodyLabel("保留文本列表（可直接编辑单元格）")
         v_layout.addWidget(table_label)
 
-        self.table = QTableWidget(0, len(self.HEADERS), self)
-        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.model = PreserveTableModel(self.HEADERS, self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed)
         self.table.verticalHeader().setVisible(False)
+        # 固定行高、关闭交替底色与自动换行，避免大数据量时逐行计算尺寸与额外绘制
+        self.table.setAlternatingRowColors(False)
+        self.table.setWordWrap(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(32)
         self._apply_table_theme()
         v_layout.addWidget(self.table)
 
@@ -162,59 +375,7 @@ class TextPreservePage(Base, QWidget):
 
     def _apply_table_theme(self) -> None:
         """根据当前主题更新表格样式"""
-        if isDarkTheme():
-            stylesheet = """
-                QTableWidget {
-                    background-color: rgb(39, 39, 39);
-                    alternate-background-color: rgb(45, 45, 45);
-                    color: rgb(200, 200, 200);
-                    border: 1px solid rgb(55, 55, 55);
-                    border-radius: 4px;
-                    gridline-color: rgb(55, 55, 55);
-                }
-                QTableWidget::item {
-                    padding: 6px;
-                }
-                QTableWidget::item:selected {
-                    background-color: rgb(70, 70, 70);
-                    color: rgb(255, 255, 255);
-                }
-                QHeaderView::section {
-                    background-color: rgb(50, 50, 50);
-                    color: rgb(200, 200, 200);
-                    padding: 8px;
-                    border: none;
-                    border-bottom: 1px solid rgb(65, 65, 65);
-                    font-weight: bold;
-                }
-            """
-        else:
-            stylesheet = """
-                QTableWidget {
-                    background-color: rgb(255, 255, 255);
-                    alternate-background-color: rgb(248, 248, 248);
-                    color: rgb(32, 32, 32);
-                    border: 1px solid rgb(220, 220, 220);
-                    border-radius: 4px;
-                    gridline-color: rgb(230, 230, 230);
-                }
-                QTableWidget::item {
-                    padding: 6px;
-                }
-                QTableWidget::item:selected {
-                    background-color: rgb(210, 210, 210);
-                    color: rgb(0, 0, 0);
-                }
-                QHeaderView::section {
-                    background-color: rgb(245, 245, 245);
-                    color: rgb(32, 32, 32);
-                    padding: 8px;
-                    border: none;
-                    border-bottom: 1px solid rgb(220, 220, 220);
-                    font-weight: bold;
-                }
-            """
-        self.table.setStyleSheet(stylesheet)
+        self.table.setStyleSheet(_DARK_TABLE_QSS if isDarkTheme() else _LIGHT_TABLE_QSS)
 
     def _on_theme_changed(self) -> None:
         """主题切换时同步更新表格样式"""
@@ -222,18 +383,15 @@ class TextPreservePage(Base, QWidget):
 
     # --- 数据操作 ---
     def _add_row(self):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        for col in range(len(self.HEADERS)):
-            self.table.setItem(row, col, QTableWidgetItem(""))
-        self.table.setCurrentCell(row, 0)
+        row = self.model.append_row(PreserveEntry())
+        self.table.setCurrentIndex(self.model.index(row, 0))
 
     def _remove_selected_rows(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             InfoBar.warning("提示", "请选择需要删除的条目", parent=self)
             return
-        self.table.removeRow(row)
+        self.model.remove_row(row)
 
     def _deduplicate_rows(self):
         """按原文去重，优先保留有备注的条目"""
@@ -242,19 +400,26 @@ class TextPreservePage(Base, QWidget):
             InfoBar.info("提示", "表格为空，暂无可去重的数据", parent=self)
             return
 
-        key_index: Dict[str, int] = {}
-        deduped: List[Dict[str, str]] = []
+        # entries 已由 _collect_table_data 去除首尾空白，这里单次遍历完成去重与备注合并
+        key_index: Dict[object, int] = {}
+        deduped: List[PreserveEntry] = []
         for item in entries:
-            key = self._normalize_src(item.get("src", ""))
+            src = item["src"]
+            comment = item["comment"]
+            key = self._normalize_src(src)
             if not key:
                 continue
-            if key not in key_index:
-                deduped.append({"src": item.get("src", "").strip(), "comment": item.get("comment", "").strip()})
-                key_index[key] = len(deduped) - 1
+            # 使用 128 位指纹作为键，长文本不必整串驻留在字典中；未安装 xxhash 时直接使用原文
+            if xxhash is not None:
+                key = xxhash.xxh3_128_intdigest(key.encode("utf-8"))
+            index = key_index.setdefault(key, len(deduped))
+            if index == len(deduped):
+                deduped.append(PreserveEntry(src, comment))
             else:
-                existing = deduped[key_index[key]]
-                merged = self._merge_entries(existing, item)
-                deduped[key_index[key]] = merged
+                # 保留更长（更完整）的备注
+                existing = deduped[index]
+                if len(comment) > len(existing.comment):
+                    existing.comment = comment
 
         removed = len(entries) - len(deduped)
         if removed > 0:
@@ -265,45 +430,41 @@ class TextPreservePage(Base, QWidget):
 
     def _clear_all(self):
         """清空表格并写回配置"""
-        self.table.setRowCount(0)
-        self.config = Config().load()
+        self.model.set_rows([])
+        self._ensure_fresh_config()
         self.config.text_preserve_data = []
         self.config.text_preserve_enable = False
-        self.config.save()
+        self._save_config()
         InfoBar.success("已清空", "已删除所有保留文本并写入配置", parent=self)
 
     def _load_from_config(self):
+        count = self._reload_table_from_config()
+        InfoBar.success("完成", f"已从配置加载 {count} 条保留文本", parent=self)
+
+    def _reload_table_from_config(self) -> int:
+        """按配置刷新表格（不弹出提示），返回加载条数"""
+        self._ensure_fresh_config()
         data = getattr(self.config, "text_preserve_data", []) or []
         converted = []
         for item in data:
             if isinstance(item, dict):
-                converted.append(
-                    {
-                        "src": item.get("src", ""),
-                        "comment": item.get("comment", ""),
-                    }
-                )
+                converted.append(PreserveEntry(item.get("src") or "", item.get("comment") or ""))
             elif isinstance(item, str): # 兼容旧格式或纯字符串列表
-                converted.append(
-                    {
-                        "src": item,
-                        "comment": "",
-                    }
-                )
+                converted.append(PreserveEntry(item))
         self._set_table_data(converted)
-        InfoBar.success("完成", f"已从配置加载 {len(converted)} 条保留文本", parent=self)
+        return len(converted)
 
     def _save_to_config(self):
         entries = self._collect_table_data()
-        self.config = Config().load()
+        self._ensure_fresh_config()
         self.config.text_preserve_data = entries
         self.config.text_preserve_enable = True if entries else self.config.text_preserve_enable
-        self.config.save()
+        self._save_config()
         InfoBar.success("保存成功", f"已写入 {len(entries)} 条保留文本到配置", parent=self)
 
     def _on_import_excel(self):
         if load_workbook is None:
-            InfoBar.error("错误", "未安装 openpyxl，无法导入 Excel", parent=self)
+            InfoBar.error("错误", "未安装 fastpyxl 或 openpyxl，无法导入 Excel", parent=self)
             return
 
         path, _ = QFileDialog.getOpenFileName(
@@ -314,31 +475,37 @@ class TextPreservePage(Base, QWidget):
         )
         if not path:
             return
+        workbook = None
         try:
-            workbook = load_workbook(path)
+            # 只读模式流式读取，仅需两列字符串，无需加载样式与单元格对象
+            workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
             sheet = workbook.active
-            headers = [str(cell.value).strip() if cell.value is not None else "" for cell in sheet[1]]
+            header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = [str(value).strip() if value is not None else "" for value in header_row]
             header_map = self._build_header_map(headers)
             if "src" not in header_map:
                 raise ValueError("未找到“原文”列，请确认模板。")
 
-            items: List[Dict[str, str]] = []
+            items: List[PreserveEntry] = []
             for row in sheet.iter_rows(min_row=2, values_only=True):
                 src = self._safe_cell(row, header_map.get("src"))
                 comment = self._safe_cell(row, header_map.get("comment"))
                 if not src:
                     continue
-                items.append({"src": src, "comment": comment})
+                items.append(PreserveEntry(src, comment))
 
             self._set_table_data(items)
             InfoBar.success("导入成功", f"已导入 {len(items)} 条保留文本", parent=self)
         except Exception as e:
             self.logger.error(f"导入失败: {e}")
             InfoBar.error("错误", f"导入失败: {e}", parent=self)
+        finally:
+            if workbook is not None:
+                workbook.close()
 
     def _on_export_excel(self):
         if Workbook is None:
-            InfoBar.error("错误", "未安装 openpyxl，无法导出 Excel", parent=self)
+            InfoBar.error("错误", "未安装 fastpyxl 或 openpyxl，无法导出 Excel", parent=self)
             return
 
         path, _ = QFileDialog.getSaveFileName(
@@ -358,12 +525,12 @@ class TextPreservePage(Base, QWidget):
             return
 
         try:
-            workbook = Workbook()
-            sheet = workbook.active
-            sheet.title = "TextPreserve"
+            # 只写模式流式写出，不保留单元格对象
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("TextPreserve")
             sheet.append(list(self.HEADERS))
-            for item in entries:
-                sheet.append([item.get("src", ""), item.get("comment", "")])
+            for row in ((item.get("src", ""), item.get("comment", "")) for item in entries):
+                sheet.append(row)
             workbook.save(path)
             InfoBar.success("导出成功", f"已保存到 {path}", parent=self)
         except Exception as e:
@@ -371,62 +538,50 @@ class TextPreservePage(Base, QWidget):
             InfoBar.error("错误", f"导出失败: {e}", parent=self)
 
     # --- 工具方法 ---
-    def _set_table_data(self, items: List[Dict[str, str]]):
-        self.table.setRowCount(0)
-        for item in items:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(item.get("src", "")))
-            self.table.setItem(row, 1, QTableWidgetItem(item.get("comment", "")))
+    @staticmethod
+    def _get_config_mtime():
+        try:
+            return os.path.getmtime(Config.CONFIG_PATH)
+        except OSError:
+            return None
+
+    def _ensure_fresh_config(self) -> None:
+        """仅当配置文件在外部被修改时才重新加载，避免每次操作都完整解析配置"""
+        mtime = self._get_config_mtime()
+        if self.config is None or mtime is None or mtime != self._config_mtime:
+            self.config = Config().load()
+            self._config_mtime = mtime
+
+    def _save_config(self) -> None:
+        self.config.save()
+        self._config_mtime = self._get_config_mtime()
+
+    def _set_table_data(self, items: List[PreserveEntry]):
+        # 调用方均传入新建的 PreserveEntry 列表，直接交给模型持有，一次性重置
+        self.model.set_rows(items)
 
     def _collect_table_data(self) -> List[Dict[str, str]]:
-        results: List[Dict[str, str]] = []
-        rows = self.table.rowCount()
-        for row in range(rows):
-            src_item = self.table.item(row, 0)
-            comment_item = self.table.item(row, 1)
-            src = (src_item.text() if src_item else "").strip()
-            comment = (comment_item.text() if comment_item else "").strip()
-            if not src:
-                continue
-            results.append({"src": src, "comment": comment})
-        return results
+        # 直接遍历模型持有的行数据，空原文行在推导式中跳过，且不再为其处理备注；
+        # 返回 dict 列表，与配置中 text_preserve_data 的持久化格式一致
+        return [
+            {"src": src, "comment": entry.comment.strip()}
+            for entry in self.model.rows()
+            if (src := entry.src.strip())
+        ]
 
     @staticmethod
     def _normalize_src(text: str) -> str:
         if not text:
             return ""
-        return text.strip().strip("\"'“”‘’").lower()
-
-    @staticmethod
-    def _merge_entries(base: Dict[str, str], incoming: Dict[str, str]) -> Dict[str, str]:
-        def _clean(v: str) -> str:
-            return v.strip() if isinstance(v, str) else ""
-
-        merged = {"src": _clean(base.get("src")), "comment": _clean(base.get("comment"))}
-        incoming_clean = {"src": _clean(incoming.get("src")), "comment": _clean(incoming.get("comment"))}
-
-        # 保留有备注的
-        if incoming_clean["comment"]:
-            if not merged["comment"] or len(incoming_clean["comment"]) > len(merged["comment"]):
-                merged["comment"] = incoming_clean["comment"]
-
-        if incoming_clean["src"] and not merged["src"]:
-            merged["src"] = incoming_clean["src"]
-        return merged
+        return text.strip().strip(_SRC_QUOTE_CHARS).lower()
 
     @staticmethod
     def _build_header_map(headers: List[str]) -> Dict[str, int]:
-        alias = {
-            "src": {"原文", "原始文本", "source", "src", "text"},
-            "comment": {"备注", "说明", "comment", "note", "备注信息"},
-        }
         mapping = {}
         for index, name in enumerate(headers):
-            lower_name = name.lower()
-            for key, options in alias.items():
-                if lower_name in {opt.lower() for opt in options} and key not in mapping:
-                    mapping[key] = index
+            key = _HEADER_ALIAS_TO_KEY.get(name.lower())
+            if key and key not in mapping:
+                mapping[key] = index
         return mapping
 
     @staticmethod
@@ -440,11 +595,8 @@ class TextPreservePage(Base, QWidget):
 
     def _on_rescan_variables(self):
         """重新扫描游戏目录，提取[variable]变量引用到禁翻表（清空旧数据）"""
-        import re
-        from pathlib import Path
-        
-        # 重新加载配置以获取最新的游戏目录
-        self.config = Config().load()
+        # 配置文件被其它页面修改过时重新加载，以获取最新的游戏目录
+        self._ensure_fresh_config()
         
         # 获取游戏目录
         game_folder = self.config.renpy_game_folder
@@ -459,28 +611,37 @@ class TextPreservePage(Base, QWidget):
                 InfoBar.error("错误", f"游戏目录不存在: {game_folder}", parent=self)
                 return
         
-        # 正则匹配 [variable_name]
-        RE_VARIABLE_IN_TEXT = re.compile(r'\[(\w+)\]')
-        
-        found_preserves = set()
-        try:
-            for rpy_file in game_path.rglob("*.rpy"):
-                try:
-                    content = rpy_file.read_text(encoding="utf-8", errors="ignore")
-                    var_matches = RE_VARIABLE_IN_TEXT.findall(content)
-                    for var_name in var_matches:
-                        found_preserves.add(f"[{var_name}]")
-                except Exception:
-                    pass
-        except Exception as e:
-            InfoBar.error("错误", f"扫描失败: {e}", parent=self)
+        if self.scan_worker and self.scan_worker.isRunning():
+            InfoBar.warning("提示", "正在扫描中，请稍候", parent=self)
+            return
+
+        # 在后台线程中扫描，避免大型游戏目录阻塞界面
+        self.scan_worker = VariableScanWorker(str(game_path))
+        self.scan_worker.finished.connect(self._on_rescan_finished)
+        self.scan_worker.start()
+        InfoBar.info("提示", "正在扫描变量引用…", parent=self)
+
+    def _on_rescan_finished(self, success: bool, result):
+        """扫描完成后写入配置并刷新表格"""
+        if not success:
+            InfoBar.error("错误", f"扫描失败: {result}", parent=self)
+            return
+
+        found_preserves = result
+
+        # 扫描期间配置可能已被其它页面修改，比较与写入前重新同步
+        self._ensure_fresh_config()
+
+        # 扫描结果与配置中的禁翻表一致时，跳过写盘与表格重载
+        if self._is_preserve_data_unchanged(found_preserves):
+            InfoBar.info("提示", f"变量引用无变化（共 {len(found_preserves)} 个），无需更新", parent=self)
             return
         
         if not found_preserves:
             # 清空禁翻表
             self.config.text_preserve_data = []
-            self.config.save()
-            self._load_from_config()
+            self._save_config()
+            self._reload_table_from_config()
             InfoBar.info("提示", "未找到变量引用，已清空禁翻表", parent=self)
             return
         
@@ -492,9 +653,20 @@ class TextPreservePage(Base, QWidget):
         # 保存到配置
         self.config.text_preserve_data = new_preserves
         self.config.text_preserve_enable = True
-        self.config.save()
+        self._save_config()
         
         # 刷新表格
-        self._load_from_config()
+        self._reload_table_from_config()
         
         InfoBar.success("完成", f"已扫描到 {len(new_preserves)} 个变量引用", parent=self)
+
+    def _is_preserve_data_unchanged(self, found_preserves: Set[str]) -> bool:
+        current = getattr(self.config, "text_preserve_data", []) or []
+        if len(current) != len(found_preserves):
+            return False
+        if found_preserves and not self.config.text_preserve_enable:
+            return False
+        return all(
+            isinstance(item, dict) and not item.get("comment") and item.get("src") in found_preserves
+            for item in current
+        ) and len({item.get("src") for item in current}) == len(found_preserves)
@@ -10,7 +10,7 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFileDialog
 from qfluentwidgets import (
     PushButton,
@@ -328,6 +328,9 @@ class TranslationWorker(QThread):
 class TranslateEngineTab(Base, QWidget):
     """翻译引擎管理标签页"""
 
+    # Engine 进度刷新最小间隔（秒）：百分比不变时在此间隔内跳过界面更新
+    UI_UPDATE_INTERVAL = 0.05
+
     def __init__(self, parent=None):
         Base.__init__(self)
         QWidget.__init__(self, parent)
@@ -340,8 +343,22 @@ class TranslateEngineTab(Base, QWidget):
         self.current_input_path: Optional[str] = None
         self.auto_save_path: Optional[str] = None
         self._last_auto_save: float = 0.0
+        # JsonExporter 无状态，导出与自动保存共用一个实例
+        self._exporter = JsonExporter()
         self.pending_items: List[dict] = []
         self.auto_save_enabled: bool = False
+        # 启动前的导出按钮与进度条状态，延迟启动失败时恢复
+        self._prev_export_enabled: bool = False
+        self._prev_progress: int = 0
+        # 上次刷新进度条的百分比与时刻，用于合并高频的 TRANSLATION_UPDATE
+        self._last_pct: int = -1
+        self._last_ui_update: float = 0.0
+        # 被节流跳过的最近一次进度 (current, total)，由单次定时器在间隔结束后补刷，保证界面停在最终值
+        self._pending_update: Optional[Tuple[int, int]] = None
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(int(self.UI_UPDATE_INTERVAL * 1000))
+        self._ui_update_timer.timeout.connect(self._flush_engine_update)
         self._init_ui()
         # 监听 Engine 事件，统一按钮状态
         self.subscribe(Base.Event.TRANSLATION_DONE, self._on_engine_done)
@@ -739,15 +756,46 @@ class TranslateEngineTab(Base, QWidget):
             InfoBar.warning("提示", "未检测到有效的接口配置，请先在接口管理中添加接口。", parent=self)
             return
 
-        # 读取 JSON（用于导出/复用，翻译由 Engine 处理）
+        # 先更新 UI 状态，读取 JSON / 配置与触发 Engine 推迟到下一轮事件循环，
+        # 让点击处理立即返回，按钮与进度条得以先行重绘
+        self._set_running_state()
+        QTimer.singleShot(0, lambda: self._launch_translation(json_file, platform))
+
+    def _set_running_state(self):
+        """切换到翻译中的按钮/进度状态（停止按钮在 Engine 任务真正发出后才启用）"""
+        self._prev_export_enabled = self.btn_export.isEnabled()
+        self._prev_progress = self.progress_bar.value()
+        self.btn_start.setEnabled(False)
+        self.btn_stop.setEnabled(False)
+        self.btn_export.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self._last_pct = 0
+        self._last_ui_update = 0.0
+        self.status_label.setText("翻译中...")
+        self.status_label.setStyleSheet("color: #0078d4;")
+
+    def _set_idle_state(self):
+        """启动失败时恢复按钮/进度状态，此前的结果仍可导出"""
+        self.btn_start.setEnabled(True)
+        self.btn_stop.setEnabled(False)
+        self.btn_export.setEnabled(self._prev_export_enabled)
+        self.progress_bar.setValue(self._prev_progress)
+        self.status_label.setText("等待开始翻译…")
+        self.status_label.setStyleSheet("")
+
+    def _launch_translation(self, json_file: str, platform: dict):
+        """读取 JSON 与配置并触发 Engine 翻译（在事件循环下一轮执行）"""
+        # 读取 JSON（用于导出/复用，翻译由 Engine 处理）；启动成功前不替换已有结果，失败时仍可导出
         try:
             importer = JsonImporter()
-            self.translations = importer.import_translations(str(json_file))
-            if not self.translations or len(self.translations) == 0:
+            translations = importer.import_translations(str(json_file))
+            if not translations or len(translations) == 0:
+                self._set_idle_state()
                 InfoBar.warning("提示", "JSON 文件中没有可翻译的内容", parent=self)
                 return
         except Exception as e:
             LogManager.get().error(f"读取 JSON 失败: {e}")
+            self._set_idle_state()
             InfoBar.error("错误", f"读取 JSON 失败: {e}", parent=self)
             return
 
@@ -763,16 +811,11 @@ class TranslateEngineTab(Base, QWidget):
             Path(config.output_folder).mkdir(parents=True, exist_ok=True)
         except Exception as e:
             self.logger.error(f"加载配置失败: {e}")
+            self._set_idle_state()
             InfoBar.error("错误", f"加载配置失败: {e}", parent=self)
             return
 
-        # 更新 UI 状态
-        self.btn_start.setEnabled(False)
-        self.btn_stop.setEnabled(True)
-        self.btn_export.setEnabled(False)
-        self.progress_bar.setValue(0)
-        self.status_label.setText("翻译中...")
-        self.status_label.setStyleSheet("color: #0078d4;")
+        self.translations = translations
 
         # 触发 Engine 翻译事件
         # 使用正确的事件触发方式，让 Translator 类处理实际的翻译逻辑
@@ -780,6 +823,7 @@ class TranslateEngineTab(Base, QWidget):
             "config": config,
             "status": Base.TranslationStatus.UNTRANSLATED,
         })
+        self.btn_stop.setEnabled(True)
 
         InfoBar.success("已开始", "翻译任务已启动，进度请查看日志面板", parent=self)
 
@@ -803,8 +847,7 @@ class TranslateEngineTab(Base, QWidget):
             return
 
         try:
-            exporter = JsonExporter()
-            if exporter.export(self.translations, save_path, include_metadata=True):
+            if self._exporter.export(self.translations, save_path, include_metadata=True):
                 LogManager.get().info(f"翻译结果已导出: {save_path}")
                 InfoBar.success("成功", f"翻译结果已导出到:\n{save_path}", parent=self)
             else:
@@ -844,7 +887,13 @@ class TranslateEngineTab(Base, QWidget):
 
     # ===== Engine 事件回调（统一进度） =====
 
+    def _cancel_pending_update(self):
+        """任务结束时丢弃待补刷的进度，避免覆盖完成/停止状态"""
+        self._ui_update_timer.stop()
+        self._pending_update = None
+
     def _on_engine_done(self, event, data):
+        self._cancel_pending_update()
         self.progress_bar.setValue(100)
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
@@ -854,6 +903,7 @@ class TranslateEngineTab(Base, QWidget):
         InfoBar.success("完成", "Engine 翻译完成", parent=self)
 
     def _on_engine_stop(self, event, data):
+        self._cancel_pending_update()
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
 
@@ -862,9 +912,31 @@ class TranslateEngineTab(Base, QWidget):
             return
         total = extras.get("total_line", 0) or 0
         current = extras.get("line", 0) or 0
-        if total > 0:
-            ratio = max(0.0, min(1.0, current / total))
-            self.progress_bar.setValue(int(ratio * 100))
+        pct = int(max(0.0, min(1.0, current / total)) * 100) if total > 0 else self._last_pct
+
+        # 百分比未变且距上次刷新不足间隔时跳过并记下，由定时器补刷；最后一行总是刷新
+        now = time.monotonic()
+        if pct == self._last_pct and now - self._last_ui_update < self.UI_UPDATE_INTERVAL and current < total:
+            self._pending_update = (current, total)
+            if not self._ui_update_timer.isActive():
+                self._ui_update_timer.start()
+            return
+        self._apply_engine_update(current, total, pct, now)
+
+    def _flush_engine_update(self):
+        """节流期结束后补刷最近一次被跳过的进度"""
+        if self._pending_update is None:
+            return
+        current, total = self._pending_update
+        pct = int(max(0.0, min(1.0, current / total)) * 100) if total > 0 else self._last_pct
+        self._apply_engine_update(current, total, pct, time.monotonic())
+
+    def _apply_engine_update(self, current: int, total: int, pct: int, now: float):
+        self._pending_update = None
+        self._last_ui_update = now
+        if pct != self._last_pct and total > 0:
+            self._last_pct = pct
+            self.progress_bar.setValue(pct)
         self.status_label.setText(f"翻译中… {current}/{total}")
 
     # ===== 自动保存辅助 =====
@@ -882,8 +954,7 @@ class TranslateEngineTab(Base, QWidget):
                 autosave_path = source_path
             else:
                 autosave_path = source_path.with_name(f"{source_path.stem}_autosave.json")
-            exporter = JsonExporter()
-            if not exporter.export(self.translations, str(autosave_path), include_metadata=True):
+            if not self._exporter.export(self.translations, str(autosave_path), include_metadata=True):
                 raise RuntimeError("初始导出失败")
 
             self.auto_save_path = str(autosave_path)
@@ -910,8 +981,7 @@ class TranslateEngineTab(Base, QWidget):
             return
 
         try:
-            exporter = JsonExporter()
-            if not exporter.export(self.translations, self.auto_save_path, include_metadata=True):
+            if not self._exporter.export(self.translations, self.auto_save_path, include_metadata=True):
                 raise RuntimeError("写入失败")
             self._last_auto_save = now
         except Exception as e:
@@ -924,8 +994,7 @@ class TranslateEngineTab(Base, QWidget):
         if not (self.auto_save_enabled and self.auto_save_path):
             return
         try:
-            exporter = JsonExporter()
-            if not exporter.export(self.translations, self.auto_save_path, include_metadata=True):
+            if not self._exporter.export(self.translations, self.auto_save_path, include_metadata=True):
                 raise RuntimeError("写入失败")
         except Exception as e:
             self.logger.error(f"自动保存最终写入失败: {e}")
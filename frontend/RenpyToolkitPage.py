@@ -3,8 +3,13 @@ Ren'Py 工具箱页面
 提供字体替换、格式化、错误检查等工具
 """
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
+import concurrent.futures
+import os
+import time
+from pathlib import Path
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFileDialog
 from qfluentwidgets import (
     FluentIcon,
     PushButton,
@@ -27,10 +32,27 @@ from module.Tool.FontReplacer import FontReplacer
 from module.Tool.Formatter import Formatter
 from module.Tool.ErrorRepairer import ErrorRepairer
 
+# InfoBar 公共参数与按级别分派的方法
+_INFOBAR_KWARGS = dict(orient=Qt.Horizontal, isClosable=True, position=InfoBarPosition.TOP)
+_INFOBAR_METHODS = {
+    "success": InfoBar.success,
+    "error": InfoBar.error,
+    "info": InfoBar.info,
+}
+
 
 class RenpyToolkitPage(QWidget):
     """Ren'Py 工具箱页面"""
 
+    # 日志框最多保留的行数（block），超出后丢弃最早的行
+    LOG_MAX_BLOCKS = 2000
+
+    # 日志合并刷新间隔（毫秒）
+    LOG_FLUSH_INTERVAL_MS = 100
+
+    # 相同提示的去重间隔（秒）
+    NOTIFY_DEDUPE_INTERVAL = 0.5
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.config = Config()
@@ -38,6 +60,12 @@ class RenpyToolkitPage(QWidget):
         self.font_replacer = FontReplacer()
         self.formatter = Formatter()
         self.error_repairer = ErrorRepairer()
+        # 上次检查遍历到的 (文件夹, .rpy 文件列表)，紧随其后的自动修复直接复用，用过即丢弃
+        self._checked_rpy: tuple[str, list[Path]] | None = None
+        # 待写入日志框的消息，由定时器合并为一次 append
+        self._log_buffer: list[str] = []
+        # (级别, 标题) -> 上次显示时刻
+        self._last_notify: dict[tuple[str, str], float] = {}
         
         self._init_ui()
         self._load_config()
@@ -73,8 +101,14 @@ class RenpyToolkitPage(QWidget):
         self.log_text.setReadOnly(True)
         self.log_text.setPlaceholderText("工具执行日志将显示在这里...")
         self.log_text.setMaximumHeight(150)
+        self.log_text.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         main_layout.addWidget(self.log_text)
 
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         main_layout.addStretch(1)
 
     def _create_font_replacement_card(self) -> CardWidget:
@@ -282,7 +316,6 @@ class RenpyToolkitPage(QWidget):
 
     def _browse_folder(self, line_edit: LineEdit):
         """浏览文件夹"""
-        from PyQt5.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(self, "选择文件夹")
         if folder:
             line_edit.setText(folder)
@@ -388,11 +421,15 @@ class RenpyToolkitPage(QWidget):
             return
 
         try:
+            # 每次检查都重新遍历，结果留给紧随其后的自动修复
+            rpy_files = list(Path(folder).rglob("*.rpy"))
+            self._checked_rpy = (os.path.abspath(folder), rpy_files)
             errors = self.error_repairer.check_folder(
                 folder,
                 check_syntax=self.check_syntax_switch.isChecked(),
                 check_indent=self.check_indent_switch.isChecked(),
-                check_quotes=self.check_quotes_switch.isChecked()
+                check_quotes=self.check_quotes_switch.isChecked(),
+                rpy_files=rpy_files
             )
 
             total_errors = sum(len(errs) for errs in errors.values())
@@ -436,18 +473,19 @@ class RenpyToolkitPage(QWidget):
             return
 
         try:
-            from pathlib import Path
-            rpy_files = list(Path(folder).rglob("*.rpy"))
-            
-            total_fixes = 0
-            for file_path in rpy_files:
-                success, fix_count = self.error_repairer.auto_fix_file(
+            rpy_files = self._take_checked_rpy(folder)
+
+            # 各文件相互独立，读写期间释放 GIL，用线程池并行处理
+            def fix_one(file_path: Path):
+                return self.error_repairer.auto_fix_file(
                     str(file_path),
                     fix_indent=True,
                     fix_quotes=False
                 )
-                if success:
-                    total_fixes += fix_count
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                results = list(executor.map(fix_one, rpy_files))
+            total_fixes = sum(fix_count for success, fix_count in results if success)
 
             self._log(f"✅ 修复完成: 共 {total_fixes} 处修复")
             self._show_success("修复完成", f"共修复 {total_fixes} 处问题")
@@ -462,7 +500,6 @@ class RenpyToolkitPage(QWidget):
             self._show_error("错误", "请先执行错误检查！")
             return
 
-        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "保存错误报告",
@@ -479,43 +516,61 @@ class RenpyToolkitPage(QWidget):
                 self._log(f"❌ 导出失败: {e}")
                 self._show_error("导出失败", str(e))
 
+    def _take_checked_rpy(self, folder: str) -> list[Path]:
+        """取出上次检查同一文件夹时遍历到的 .rpy 列表（仅使用一次），否则重新遍历"""
+        checked, self._checked_rpy = self._checked_rpy, None
+        if checked is not None and checked[0] == os.path.abspath(folder):
+            return checked[1]
+        return list(Path(folder).rglob("*.rpy"))
+
     def _log(self, message: str):
-        """添加日志"""
-        self.log_text.append(message)
+        """添加日志（日志框批量刷新）"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
         self.logger.info(message)
 
-    def _show_success(self, title: str, content: str):
-        """显示成功提示"""
-        InfoBar.success(
+    def _flush_log(self):
+        """将缓冲的日志追加到日志框，期间暂停重绘
+
+        逐条 append：Qt 按每次 append 的开头判断纯文本还是 HTML，整批拼接后若首行像标记（如 .rpy 中的 <b>），
+        整批都会被当作 HTML 渲染而挤成一行。超出保留行数的旧消息本就会被丢弃，只追加最后 LOG_MAX_BLOCKS 条。
+        """
+        if not self._log_buffer:
+            return
+        messages = self._log_buffer[-self.LOG_MAX_BLOCKS:]
+        self._log_buffer.clear()
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            for message in messages:
+                self.log_text.append(message)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+
+    def _notify(self, level: str, title: str, content: str, duration: int = 3000):
+        """显示 InfoBar 提示，500ms 内相同级别与标题的提示只显示一次"""
+        now = time.monotonic()
+        key = (level, title)
+        if now - self._last_notify.get(key, -1.0) < self.NOTIFY_DEDUPE_INTERVAL:
+            return
+        self._last_notify[key] = now
+
+        _INFOBAR_METHODS[level](
             title=title,
             content=content,
-            orient=Qt.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=3000,
-            parent=self
+            duration=duration,
+            parent=self,
+            **_INFOBAR_KWARGS
         )
 
+    def _show_success(self, title: str, content: str):
+        """显示成功提示"""
+        self._notify("success", title, content)
+
     def _show_error(self, title: str, content: str):
         """显示错误提示"""
-        InfoBar.error(
-            title=title,
-            content=content,
-            orient=Qt.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=5000,
-            parent=self
-        )
+        self._notify("error", title, content, duration=5000)
 
     def _show_info(self, title: str, content: str):
         """显示信息提示"""
-        InfoBar.info(
-            title=title,
-            content=content,
-            orient=Qt.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=3000,
-            parent=self
-        )
+        self._notify("info", title, content)
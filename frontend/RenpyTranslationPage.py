@@ -5,10 +5,11 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QSignalBlocker, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFileDialog
 from qfluentwidgets import (
     FluentIcon,
@@ -28,7 +29,6 @@ from qfluentwidgets import (
 
 from base.LogManager import LogManager
 from module.Config import Config
-from module.Extract.UnifiedExtractor import UnifiedExtractor
 from module.Extract.ReplaceGenerator import (
     scan_missing_and_update_glossary,
     check_miss_rpy_status,
@@ -36,9 +36,138 @@ from module.Extract.ReplaceGenerator import (
     write_replace_script,
     sync_miss_rpy_with_glossary,
     archive_miss_file,
+    MISS_DIR,
+    MISS_RPY,
 )
 from widget.ThemeHelper import mark_toolbox_widget, mark_toolbox_scroll_area
 
+if TYPE_CHECKING:
+    from module.Extract.UnifiedExtractor import UnifiedExtractor
+
+
+# 判断 tl 目录是否已有翻译时忽略的顶层子目录、文件名前缀与工具生成的文件
+_TL_SKIP_DIRS = frozenset({"base_box", "fonts"})
+_TL_SKIP_PREFIXES = ("miss_ready_replace", "hook_")
+_TL_SKIP_NAMES = frozenset({
+    "choice_screen_fix_auto.rpy",
+    "replace_text_auto.rpy",
+    "set_default_language_at_startup.rpy",
+})
+
+
+def _is_effective_tl_rpy(name_lower: str) -> bool:
+    """已小写的 .rpy 文件名是否算作有效翻译文件"""
+    return not name_lower.startswith(_TL_SKIP_PREFIXES) and name_lower not in _TL_SKIP_NAMES
+
+
+def _iter_effective_rpy(root: str) -> Iterator[str]:
+    """按需遍历 tl 目录下的有效 .rpy（跳过 base_box/fonts 子树与工具生成的文件），找到即可停止"""
+    stack = [(root, True)]
+    while stack:
+        current, top_level = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if entry.is_dir(follow_symlinks=False):
+                        if top_level and name in _TL_SKIP_DIRS:
+                            continue
+                        stack.append((entry.path, False))
+                    elif name.endswith(".rpy") and _is_effective_tl_rpy(name):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _debounced(slot: Callable[[], None], timeout: int, parent: QWidget) -> Callable[..., None]:
+    """返回 slot 的防抖包装：连续触发时只在最后一次触发 timeout 毫秒后调用一次（忽略信号参数）"""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(timeout)
+    timer.timeout.connect(slot)
+    return lambda *_: timer.start()
+
+
+class ExtractWorker(QThread):
+    """后台抽取线程：已有 tl 预检 + 编码预检 + 官方/补充抽取"""
+    progress = pyqtSignal(str, int)  # message, percent
+    incremental_detected = pyqtSignal()  # 检测到已有翻译，将使用增量抽取
+    finished = pyqtSignal(bool, str)  # success, message
+
+    def __init__(
+        self,
+        unified_extractor: UnifiedExtractor,
+        project_root: Path,
+        tl_name: str,
+        exe_path: Optional[Path],
+        use_official: bool,
+        check_encoding: Optional[str] = None,
+    ):
+        super().__init__()
+        self.unified_extractor = unified_extractor
+        self.project_root = project_root
+        self.tl_name = tl_name
+        self.exe_path = exe_path
+        self.use_official = use_official
+        self.check_encoding = check_encoding  # 关闭自动检测编码时的默认编码，None 表示不预检
+
+    def run(self):
+        try:
+            tl_dir = self.project_root / "game" / "tl" / self.tl_name
+            has_existing_tl = next(_iter_effective_rpy(str(tl_dir)), None) is not None
+
+            # 编码预检：关闭自动检测时尝试读取一个文件
+            if self.check_encoding:
+                sample_file = next(tl_dir.rglob("*.rpy"), None)
+                if sample_file:
+                    try:
+                        sample_file.read_text(encoding=self.check_encoding)
+                    except Exception as e:
+                        self.finished.emit(False, f"默认编码读取失败: {self.check_encoding}\n{e}")
+                        return
+
+            self.unified_extractor.set_progress_callback(
+                lambda msg, pct: self.progress.emit(msg, pct)
+            )
+            if has_existing_tl:
+                self.incremental_detected.emit()
+                result = self.unified_extractor.extract_incremental(
+                    self.project_root,
+                    self.tl_name,
+                    self.exe_path,
+                    use_official=self.use_official
+                )
+            else:
+                result = self.unified_extractor.extract_regular(
+                    self.project_root,
+                    self.tl_name,
+                    self.exe_path,
+                    use_official=self.use_official
+                )
+            self.finished.emit(result.success, result.message)
+        except Exception as e:
+            LogManager.get().error(f"抽取失败: {e}")
+            self.finished.emit(False, str(e))
+        finally:
+            self.unified_extractor.set_progress_callback(None)
+
+
+class CallWorker(QThread):
+    """在后台线程执行一个无参函数（扫描缺失、生成钩子等磁盘操作）"""
+    finished = pyqtSignal(bool, object)  # success, 返回值或异常
+
+    def __init__(self, func: Callable[[], object]):
+        super().__init__()
+        self.func = func
+
+    def run(self):
+        try:
+            result = self.func()
+        except Exception as e:
+            self.finished.emit(False, e)
+            return
+        self.finished.emit(True, result)
+
 
 class RenpyTranslationPage(QWidget):
     """翻译抽取到 TL - 简化版"""
@@ -47,15 +176,44 @@ class RenpyTranslationPage(QWidget):
         super().__init__(parent=parent)
         self.logger = LogManager.get()
         self.config = Config().load()
-        self._miss_status_timer = QTimer(self)
-        self._miss_status_timer.setSingleShot(True)
-        self._miss_status_timer.timeout.connect(self._update_miss_status)
+        # 用户粘贴/输入路径时合并高频触发，避免每次按键都读盘刷新 miss 状态
+        self._update_miss_status_debounced = _debounced(self._update_miss_status, 150, self)
         # 保底：至少开启补充抽取，避免全关导致不会跑
         if not self.config.extract_use_official and not self.config.extract_use_custom:
             self.config.extract_use_custom = True
-        self.unified_extractor = UnifiedExtractor()
+        # 抽取器在首次抽取时才创建
+        self._unified_extractor: Optional[UnifiedExtractor] = None
+        # 当前后台任务（抽取/扫描/生成钩子同一时间只跑一个）
+        self._worker: Optional[QThread] = None
+        # (target, tl) -> (相关文件/目录的 mtime/size 快照, check_miss_rpy_status 结果)
+        self._miss_status_cache: dict[tuple[str, str], tuple[tuple, dict]] = {}
+        # (目录, 目录 mtime_ns) -> 自动查找到的 exe
+        self._exe_cache: dict[tuple[str, int], Optional[Path]] = {}
+        # 配置延迟合并写盘：短时间内的多次修改只写一次
+        self._config_dirty = False
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.timeout.connect(self._flush_config)
+        # 高级选项控件在首次展开时创建，之前保持 None
+        self.chk_official: Optional[CheckBox] = None
+        self.chk_custom: Optional[CheckBox] = None
+        self.chk_skip_hooks: Optional[CheckBox] = None
+        self.exe_edit: Optional[LineEdit] = None
+        self.scan_btn: Optional[PushButton] = None
+        self.hook_btn: Optional[PushButton] = None
+        self.miss_status: Optional[CaptionLabel] = None
+        # _refresh_option_state 重入保护
+        self._refreshing_options = False
         self._init_ui()
 
+    @property
+    def unified_extractor(self) -> UnifiedExtractor:
+        """首次使用时再导入并创建 UnifiedExtractor，不拖慢页面构建"""
+        if self._unified_extractor is None:
+            from module.Extract.UnifiedExtractor import UnifiedExtractor
+            self._unified_extractor = UnifiedExtractor()
+        return self._unified_extractor
+
     def _init_ui(self) -> None:
         self.setObjectName("RenpyTranslationPage")
         mark_toolbox_widget(self)
@@ -84,7 +242,7 @@ class RenpyTranslationPage(QWidget):
         # 主功能区
         scroll_layout.addWidget(self._create_main_card())
         
-        # 高级功能（折叠）
+        # 高级功能（折叠，内容在首次展开时才构建）
         scroll_layout.addWidget(self._create_advanced_card())
         
         scroll_layout.addStretch(1)
@@ -98,21 +256,36 @@ class RenpyTranslationPage(QWidget):
 
         # 输入变化时自动刷新缺失状态（避免返回页面后还要手动点“扫描缺失”）
         try:
-            self.game_dir_edit.textChanged.connect(self._schedule_miss_status_update)
-            self.tl_name_edit.textChanged.connect(self._schedule_miss_status_update)
+            self.game_dir_edit.textChanged.connect(self._update_miss_status_debounced)
+            self.tl_name_edit.textChanged.connect(self._update_miss_status_debounced)
         except Exception:
             pass
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
         # 页面回到前台时刷新 miss 状态
-        self._schedule_miss_status_update()
-
-    def _schedule_miss_status_update(self) -> None:
-        if not hasattr(self, "miss_status"):
-            return
-        # 轻量防抖：用户粘贴/输入路径时避免高频 IO
-        self._miss_status_timer.start(200)
+        self._update_miss_status_debounced()
+
+    def hideEvent(self, event) -> None:
+        # 切走页面时把未写盘的配置落盘
+        self._flush_config()
+        super().hideEvent(event)
+
+    def closeEvent(self, event) -> None:
+        self._flush_config()
+        super().closeEvent(event)
+
+    def _save_config_later(self) -> None:
+        """标记配置已修改，500ms 内无新修改时写盘"""
+        self._config_dirty = True
+        self._config_save_timer.start(500)
+
+    def _flush_config(self) -> None:
+        """立即写出待保存的配置"""
+        self._config_save_timer.stop()
+        if self._config_dirty:
+            self._config_dirty = False
+            self.config.save()
 
     def _create_main_card(self) -> CardWidget:
         """主功能卡片 - 极简"""
@@ -158,7 +331,7 @@ class RenpyTranslationPage(QWidget):
         return card
 
     def _create_advanced_card(self) -> CardWidget:
-        """高级选项卡片 - 默认折叠"""
+        """高级选项卡片 - 默认折叠，只构建标题行"""
         card = CardWidget(self)
         mark_toolbox_widget(card)
         layout = QVBoxLayout(card)
@@ -173,7 +346,13 @@ class RenpyTranslationPage(QWidget):
         header.addStretch(1)
         layout.addLayout(header)
 
-        # 高级选项内容（默认隐藏）
+        self._advanced_layout = layout
+        self.advanced_widget: Optional[QWidget] = None
+
+        return card
+
+    def _build_advanced_widget(self) -> None:
+        """首次展开时构建高级选项内容"""
         self.advanced_widget = QWidget()
         adv_layout = QVBoxLayout(self.advanced_widget)
         adv_layout.setContentsMargins(0, 8, 0, 0)
@@ -220,12 +399,9 @@ class RenpyTranslationPage(QWidget):
         # === 缺失补丁工具 ===
         adv_layout.addWidget(self._create_miss_section())
 
-        layout.addWidget(self.advanced_widget)
-        self.advanced_widget.setVisible(False)  # 默认折叠
+        self._advanced_layout.addWidget(self.advanced_widget)
         self._refresh_option_state()
 
-        return card
-
     def _create_miss_section(self) -> QWidget:
         """缺失补丁区域"""
         widget = QWidget()
@@ -265,8 +441,15 @@ class RenpyTranslationPage(QWidget):
     def _toggle_advanced(self):
         """切换高级选项显示"""
         try:
-            visible = not self.advanced_widget.isVisible()
+            if self.advanced_widget is None:
+                self._build_advanced_widget()
+                visible = True
+            else:
+                visible = not self.advanced_widget.isVisible()
             self.advanced_widget.setVisible(visible)
+            if visible:
+                # 折叠期间不刷新 miss 状态，展开时补一次
+                self._update_miss_status()
             # 更新按钮文字来表示展开/折叠状态
             text = "▼ 高级选项" if visible else "▶ 高级选项"
             self.advanced_toggle.setText(text)
@@ -277,6 +460,8 @@ class RenpyTranslationPage(QWidget):
 
     def _do_extract(self):
         """执行抽取（主按钮）"""
+        if self._is_busy():
+            return
         try:
             game_dir = self.game_dir_edit.text().strip()
             if not game_dir:
@@ -310,46 +495,16 @@ class RenpyTranslationPage(QWidget):
                 InfoBar.error("错误", f"未找到 tl 子目录: {tl_dir}", parent=self)
                 return
 
-            def _is_effective_tl_rpy(path: Path) -> bool:
-                name = path.name.lower()
-                try:
-                    rel = path.relative_to(tl_dir)
-                    if rel.parts and rel.parts[0].lower() in {"base_box", "fonts"}:
-                        return False
-                except Exception:
-                    pass
-                if name.startswith("miss_ready_replace"):
-                    return False
-                if name.startswith("hook_"):
-                    return False
-                if name == "choice_screen_fix_auto.rpy":
-                    return False
-                if name in {"replace_text_auto.rpy", "set_default_language_at_startup.rpy"}:
-                    return False
-                return True
-
-            has_existing_tl = any(_is_effective_tl_rpy(p) for p in tl_dir.rglob("*.rpy"))
-
-            # 编码预检：关闭自动检测时尝试读取一个文件
-            if not self.config.renpy_auto_detect_encoding:
-                sample_file = next(tl_dir.rglob("*.rpy"), None)
-                if sample_file:
-                    try:
-                        sample_file.read_text(encoding=self.config.renpy_default_encoding)
-                    except Exception as e:
-                        InfoBar.error("错误", f"默认编码读取失败: {self.config.renpy_default_encoding}\n{e}", parent=self)
-                        return
-
             # 获取选项
-            use_official = self.chk_official.isChecked() if hasattr(self, 'chk_official') else self.config.extract_use_official
-            use_custom = self.chk_custom.isChecked() if hasattr(self, 'chk_custom') else self.config.extract_use_custom
+            use_official = self.chk_official.isChecked() if self.chk_official is not None else self.config.extract_use_official
+            use_custom = self.chk_custom.isChecked() if self.chk_custom is not None else self.config.extract_use_custom
 
             if not use_official and not use_custom:
                 use_custom = True  # 至少启用补充抽取
 
             # 自动查找 exe
             if use_official and not exe_path:
-                exe_edit_text = self.exe_edit.text().strip() if hasattr(self, 'exe_edit') else ""
+                exe_edit_text = self.exe_edit.text().strip() if self.exe_edit is not None else ""
                 if exe_edit_text:
                     exe_path = Path(exe_edit_text)
                 else:
@@ -360,7 +515,7 @@ class RenpyTranslationPage(QWidget):
                 # 未找到 exe 时自动回退到补充抽取，避免“官方开但补充关”时无法抽取
                 if not use_custom:
                     use_custom = True
-                    if hasattr(self, "chk_custom"):
+                    if self.chk_custom is not None:
                         try:
                             self.chk_custom.setChecked(True)
                         except Exception:
@@ -372,127 +527,171 @@ class RenpyTranslationPage(QWidget):
             self.config.renpy_game_folder = game_dir
             self.config.extract_use_official = use_official
             self.config.extract_use_custom = use_custom
-            if hasattr(self, 'chk_skip_hooks'):
+            if self.chk_skip_hooks is not None:
                 self.config.extract_skip_hook_files = self.chk_skip_hooks.isChecked()
-            self.config.save()
+            # 抽取器会从磁盘重新读取配置，开始前必须立即写出（与之前浏览目录的修改合并为一次写入）
+            self._save_config_later()
+            self._flush_config()
 
-            # 执行抽取
+            # 执行抽取（已有 tl 预检、编码预检与抽取本身都在后台线程进行）
             self._begin("正在抽取翻译文本…")
 
-            if has_existing_tl:
-                self.logger.info("检测到已有翻译，启用增量抽取以保留译文")
-                InfoBar.info("增量模式", "检测到已有 tl，增量抽取会保留已翻译内容", parent=self)
-                result = self.unified_extractor.extract_incremental(
-                    project_root,
-                    tl_name,
-                    exe_path,
-                    use_official=use_official
-                )
-            else:
-                result = self.unified_extractor.extract_regular(
-                    project_root,
-                    tl_name,
-                    exe_path,
-                    use_official=use_official
-                )
-
-            self._end(result.success)
-            
-            if result.success:
-                InfoBar.success("抽取完成", result.message, parent=self)
-                # 更新缺失状态
-                if hasattr(self, 'miss_status'):
-                    self._update_miss_status()
-            else:
-                InfoBar.error("抽取失败", result.message, parent=self)
+            worker = ExtractWorker(
+                self.unified_extractor,
+                project_root,
+                tl_name,
+                exe_path,
+                use_official,
+                check_encoding=None if self.config.renpy_auto_detect_encoding else self.config.renpy_default_encoding,
+            )
+            worker.progress.connect(self._on_extract_progress)
+            worker.incremental_detected.connect(self._on_incremental_detected)
+            worker.finished.connect(self._on_extract_done)
+            self._worker = worker
+            worker.start()
 
         except Exception as e:
             self.logger.error(f"抽取失败: {e}")
             InfoBar.error("错误", str(e), parent=self)
             self._end(False)
 
+    def _on_extract_progress(self, message: str, percent: int):
+        self.progress_bar.setValue(percent)
+
+    def _on_incremental_detected(self):
+        self.logger.info("检测到已有翻译，启用增量抽取以保留译文")
+        InfoBar.info("增量模式", "检测到已有 tl，增量抽取会保留已翻译内容", parent=self)
+
+    def _on_extract_done(self, success: bool, message: str):
+        self._end(success)
+
+        if success:
+            InfoBar.success("抽取完成", message, parent=self)
+            # 更新缺失状态
+            self._update_miss_status()
+        else:
+            InfoBar.error("抽取失败", message, parent=self)
+
     def _scan_missing(self):
         """扫描缺失文本并反补角色名到术语库"""
+        if self._is_busy():
+            return
         try:
             target, tl, _ = self._resolve_paths()
             self._begin("正在扫描…")
-
-            miss_path, count, added_names = scan_missing_and_update_glossary(target, tl)
-            self._update_miss_status()
-
-            if count == 0:
-                InfoBar.success(
-                    "扫描完成",
-                    "未发现缺失文本",
-                    parent=self
-                )
-            else:
-                msg = f"发现 {count} 条缺失文本"
-                if added_names > 0:
-                    msg += f"，已将 {added_names} 个角色名添加到术语库"
-                InfoBar.success("扫描完成", msg, parent=self)
-            self._end(True)
+            self._run_in_background(
+                lambda: scan_missing_and_update_glossary(target, tl),
+                self._on_scan_missing_done,
+            )
         except Exception as e:
             self.logger.error(f"扫描失败: {e}")
             InfoBar.error("错误", str(e), parent=self)
             self._end(False)
 
+    def _on_scan_missing_done(self, success: bool, result: object):
+        if not success:
+            self.logger.error(f"扫描失败: {result}")
+            InfoBar.error("错误", str(result), parent=self)
+            self._end(False)
+            return
+
+        _, count, added_names = result
+        self._miss_status_cache.clear()
+        self._update_miss_status()
+
+        if count == 0:
+            InfoBar.success(
+                "扫描完成",
+                "未发现缺失文本",
+                parent=self
+            )
+        else:
+            msg = f"发现 {count} 条缺失文本"
+            if added_names > 0:
+                msg += f"，已将 {added_names} 个角色名添加到术语库"
+            InfoBar.success("扫描完成", msg, parent=self)
+        self._end(True)
+
     def _generate_hook(self):
         """生成 replace 钩子"""
+        if self._is_busy():
+            return
         try:
             target, tl, project_root = self._resolve_paths()
             self._begin("正在生成钩子…")
-
-            tl_dir = project_root / "game" / "tl" / tl
-            status = check_miss_rpy_status(target, tl)
-            miss_path = status.get("path") if isinstance(status, dict) else None
-            if not status.get("exists"):
-                self.progress_bar.setVisible(False)
-                InfoBar.warning(
-                    "提示",
-                    "请先点击「扫描缺失」生成 miss_ready_replace.rpy",
-                    parent=self
-                )
-                return
-            
-            # 先同步术语库翻译到 miss_ready_replace.rpy
-            synced = sync_miss_rpy_with_glossary(project_root / "game", tl)
-            if synced > 0:
-                self.logger.info(f"已从术语库同步 {synced} 条翻译到 miss_ready_replace.rpy")
-            
-            pairs = parse_miss_rpy(project_root / "game", tl)
-
-            if not pairs:
-                self.progress_bar.setVisible(False)
-                InfoBar.warning(
-                    "提示",
-                    f"请先编辑 {miss_path or 'miss_ready_replace.rpy'}，将 new 字段改为译文",
-                    parent=self
-                )
-                return
-
-            output = tl_dir / "replace_text_auto.rpy"
-            write_replace_script(output, pairs)
-
-            archived = archive_miss_file(target, tl)
-
-            self._end(True)
-            self._update_miss_status()
-            if archived:
-                InfoBar.success("完成", f"已生成钩子 ({len(pairs)} 条)，并已归档 miss 文件", parent=self)
-            else:
-                InfoBar.success("完成", f"已生成钩子 ({len(pairs)} 条)", parent=self)
-
+            self._run_in_background(
+                lambda: self._generate_hook_files(target, tl, project_root),
+                self._on_generate_hook_done,
+            )
         except Exception as e:
             self.logger.error(f"生成钩子失败: {e}")
             InfoBar.error("错误", str(e), parent=self)
             self._end(False)
 
+    def _generate_hook_files(self, target: str, tl: str, project_root: Path) -> tuple[str, object]:
+        """后台线程：同步术语库、解析 miss 文件并写出钩子，返回 (结果类型, 数据)"""
+        tl_dir = project_root / "game" / "tl" / tl
+        status = check_miss_rpy_status(target, tl)
+        miss_path = status.get("path") if isinstance(status, dict) else None
+        if not status.get("exists"):
+            return "no_miss", None
+
+        # 先同步术语库翻译到 miss_ready_replace.rpy
+        synced = sync_miss_rpy_with_glossary(project_root / "game", tl)
+        if synced > 0:
+            self.logger.info(f"已从术语库同步 {synced} 条翻译到 miss_ready_replace.rpy")
+
+        pairs = parse_miss_rpy(project_root / "game", tl)
+        if not pairs:
+            return "no_pairs", miss_path
+
+        output = tl_dir / "replace_text_auto.rpy"
+        write_replace_script(output, pairs)
+
+        archived = archive_miss_file(target, tl)
+        return "done", (len(pairs), archived)
+
+    def _on_generate_hook_done(self, success: bool, result: object):
+        if not success:
+            self.logger.error(f"生成钩子失败: {result}")
+            InfoBar.error("错误", str(result), parent=self)
+            self._end(False)
+            return
+
+        kind, data = result
+        if kind == "no_miss":
+            self._end(True)
+            InfoBar.warning(
+                "提示",
+                "请先点击「扫描缺失」生成 miss_ready_replace.rpy",
+                parent=self
+            )
+            return
+        if kind == "no_pairs":
+            self._end(True)
+            InfoBar.warning(
+                "提示",
+                f"请先编辑 {data or 'miss_ready_replace.rpy'}，将 new 字段改为译文",
+                parent=self
+            )
+            return
+
+        count, archived = data
+        self._end(True)
+        self._miss_status_cache.clear()
+        self._update_miss_status()
+        if archived:
+            InfoBar.success("完成", f"已生成钩子 ({count} 条)，并已归档 miss 文件", parent=self)
+        else:
+            InfoBar.success("完成", f"已生成钩子 ({count} 条)", parent=self)
+
     def _update_miss_status(self):
-        """更新缺失状态显示"""
+        """更新缺失状态显示（高级选项未展开或页面不可见时跳过，避免无谓的磁盘读取）"""
+        if self.advanced_widget is None or not self.advanced_widget.isVisible():
+            return
         try:
-            target, tl, _ = self._resolve_paths()
-            status = check_miss_rpy_status(target, tl)
+            target, tl, project_root = self._resolve_paths()
+            status = self._get_miss_status(target, tl, project_root)
 
             if not status["exists"]:
                 if status.get("hook_exists"):
@@ -525,6 +724,29 @@ class RenpyTranslationPage(QWidget):
 
     # ==================== 工具方法 ====================
 
+    def _get_miss_status(self, target: str, tl: str, project_root: Path) -> dict:
+        """check_miss_rpy_status 的缓存版本：tl/miss 目录与 miss 文件的 mtime/size 都未变时直接复用上次结果"""
+        tl_dir = project_root / "game" / "tl" / tl
+        miss_dir = tl_dir / MISS_DIR
+        stamps = []
+        # 目录 mtime 覆盖 miss/钩子/归档文件的增删，miss 文件自身的 mtime/size 覆盖内容编辑
+        for path in (tl_dir, miss_dir, miss_dir / MISS_RPY, tl_dir / MISS_RPY):
+            try:
+                stat = path.stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        stamps = tuple(stamps)
+
+        key = (target, tl)
+        cached = self._miss_status_cache.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        status = check_miss_rpy_status(target, tl)
+        self._miss_status_cache[key] = (stamps, status)
+        return status
+
     def _resolve_paths(self) -> tuple[str, str, Path]:
         """解析路径"""
         game_dir = self.game_dir_edit.text().strip()
@@ -540,33 +762,71 @@ class RenpyTranslationPage(QWidget):
             project_root = path
 
         tl = self.tl_name_edit.text().strip() or "chinese"
-        target = self.exe_edit.text().strip() if hasattr(self, 'exe_edit') and self.exe_edit.text().strip() else str(project_root)
+        target = self.exe_edit.text().strip() if self.exe_edit is not None and self.exe_edit.text().strip() else str(project_root)
 
         return target, tl, project_root
 
     def _auto_find_exe(self, root_dir: Path) -> Optional[Path]:
-        """自动查找 exe"""
-        for pattern in ("*.exe", "*.py"):
-            for f in root_dir.glob(pattern):
-                if f.is_file() and f.stat().st_size > 1024:
-                    return f
-        return None
+        """自动查找 exe（目录 mtime 未变时复用上次结果）"""
+        try:
+            key = (str(root_dir), root_dir.stat().st_mtime_ns)
+        except OSError:
+            return None
+        if key in self._exe_cache:
+            return self._exe_cache[key]
+
+        # 单次遍历同时收集 .exe 与 .py 候选，优先返回 .exe
+        exe_found: Optional[Path] = None
+        py_found: Optional[Path] = None
+        try:
+            with os.scandir(root_dir) as it:
+                for entry in it:
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    if suffix == ".exe" or (suffix == ".py" and py_found is None):
+                        try:
+                            if not entry.is_file() or entry.stat().st_size <= 1024:
+                                continue
+                        except OSError:
+                            continue
+                        if suffix == ".exe":
+                            exe_found = Path(entry.path)
+                            break
+                        py_found = Path(entry.path)
+        except OSError:
+            pass
+
+        found = exe_found or py_found
+        self._exe_cache = {key: found}
+        return found
 
     def _browse_game_dir(self):
         path = QFileDialog.getExistingDirectory(self, "选择游戏目录")
         if path:
-            self.game_dir_edit.setText(path)
+            # 下面会直接刷新一次 miss 状态，屏蔽 textChanged 避免再触发一次
+            with QSignalBlocker(self.game_dir_edit):
+                self.game_dir_edit.setText(path)
             self.config.renpy_game_folder = path
-            self.config.save()
-            if hasattr(self, 'miss_status'):
-                self._update_miss_status()
+            self._save_config_later()
+            self._update_miss_status()
 
     def _browse_exe(self, edit: LineEdit):
         path, _ = QFileDialog.getOpenFileName(
             self, "选择游戏可执行文件", "", "可执行文件 (*.exe *.py)"
         )
         if path:
-            edit.setText(path)
+            with QSignalBlocker(edit):
+                edit.setText(path)
+
+    def _is_busy(self) -> bool:
+        """是否有后台任务正在运行"""
+        return self._worker is not None and self._worker.isRunning()
+
+    def _run_in_background(self, func: Callable[[], object], on_done: Callable[[bool, object], None]):
+        """在 CallWorker 中执行 func，完成后在 GUI 线程回调 on_done(success, result)"""
+        worker = CallWorker(func)
+        worker.finished.connect(on_done)
+        self._worker = worker
+        worker.start()
 
     def _begin(self, msg: str):
         self.progress_bar.setVisible(True)
@@ -581,11 +841,14 @@ class RenpyTranslationPage(QWidget):
 
     def _refresh_option_state(self):
         """根据勾选状态刷新控件可用性"""
+        if self._refreshing_options:
+            return
+        self._refreshing_options = True
         try:
-            use_official = self.chk_official.isChecked() if hasattr(self, 'chk_official') else False
-            use_custom = self.chk_custom.isChecked() if hasattr(self, 'chk_custom') else True
+            use_official = self.chk_official.isChecked() if self.chk_official is not None else False
+            use_custom = self.chk_custom.isChecked() if self.chk_custom is not None else True
 
-            if hasattr(self, 'exe_edit'):
+            if self.exe_edit is not None:
                 self.exe_edit.setEnabled(use_official)
                 if not use_official:
                     self.exe_edit.setPlaceholderText("仅勾选官方抽取时需要，留空自动查找 .exe")
@@ -593,7 +856,7 @@ class RenpyTranslationPage(QWidget):
                     self.exe_edit.setPlaceholderText("留空自动查找 .exe")
 
             # 缺失补丁工具依赖官方抽取结果，未开启时禁用
-            if hasattr(self, 'scan_btn') and hasattr(self, 'hook_btn'):
+            if self.scan_btn is not None and self.hook_btn is not None:
                 enable_missing = use_official
                 self.scan_btn.setEnabled(enable_missing)
                 self.hook_btn.setEnabled(enable_missing and self.hook_btn.isEnabled())
@@ -603,6 +866,9 @@ class RenpyTranslationPage(QWidget):
 
             # 至少保证有一种抽取方式
             if not use_official and not use_custom:
-                self.chk_custom.setChecked(True)
+                with QSignalBlocker(self.chk_custom):
+                    self.chk_custom.setChecked(True)
         except Exception as e:
             self.logger.warning(f"刷新选项状态失败: {e}")
+        finally:
+            self._refreshing_options = False
@@ -15,12 +15,19 @@ from widget.SwitchButtonCard import SwitchButtonCard
 
 class BasicSettingsPage(QWidget, Base):
 
+    # 数值设置卡片：(配置字段, 标题文本键, 描述文本键)
+    SPIN_CARDS = (
+        ("max_workers", "basic_settings_page_max_workers_title", "basic_settings_page_max_workers_content"),                # 每秒任务数阈值
+        ("rpm_threshold", "basic_settings_page_rpm_threshold_title", "basic_settings_page_rpm_threshold_content"),          # 每分钟任务数阈值
+        ("token_threshold", "basic_settings_page_token_threshold_title", "basic_settings_page_token_threshold_content"),    # 翻译任务长度阈值
+        ("request_timeout", "basic_settings_page_request_timeout_title", "basic_settings_page_request_timeout_content"),    # 请求超时时间
+        ("max_round", "basic_settings_page_max_round_title", "basic_settings_page_max_round_content"),                      # 翻译流程最大轮次
+    )
+
     def __init__(self, text: str, window: FluentWindow) -> None:
         super().__init__(window)
         self.setObjectName(text.replace(" ", "-"))
-
-        # 载入并保存默认配置
-        config = Config().load().save()
+        self.main_window = window
 
         # 设置容器
         self.root = QVBoxLayout(self)
@@ -41,117 +48,50 @@ class BasicSettingsPage(QWidget, Base):
         # 将滚动区域添加到父布局
         self.root.addWidget(scroll_area)
 
-        # 添加控件
-        self.add_widget_max_workers(scroll_area_vbox, config, window)
-        self.add_widget_rpm_threshold(scroll_area_vbox, config, window)
-        self.add_widget_token_threshold(scroll_area_vbox, config, window)
-        self.add_widget_request_timeout(scroll_area_vbox, config, window)
-        self.add_widget_max_round(scroll_area_vbox, config, window)
-        # 自定义提示词（可选）
-
-        # 填充
-        scroll_area_vbox.addStretch(1)
-
-    # 每秒任务数阈值
-    def add_widget_max_workers(self, parent: QLayout, config: Config, window: FluentWindow) -> None:
-
-        def init(widget: SpinCard) -> None:
-            widget.get_spin_box().setRange(0, 9999999)
-            widget.get_spin_box().setValue(config.max_workers)
+        # 设置卡片在页面首次显示时再创建，不拖慢主窗口启动
+        self.scroll_area_vbox = scroll_area_vbox
+        self.widgets_built = False
 
-        def value_changed(widget: SpinCard) -> None:
-            config = Config().load()
-            config.max_workers = widget.get_spin_box().value()
-            config.save()
+    # 首次显示时创建控件
+    def showEvent(self, event) -> None:
+        if not self.widgets_built:
+            self.widgets_built = True
+            self.build_widgets(self.scroll_area_vbox, self.main_window)
+        super().showEvent(event)
 
-        parent.addWidget(
-            SpinCard(
-                title = Localizer.get().basic_settings_page_max_workers_title,
-                description = Localizer.get().basic_settings_page_max_workers_content,
-                init = init,
-                value_changed = value_changed,
-            )
-        )
-
-    # 每分钟任务数阈值
-    def add_widget_rpm_threshold(self, parent: QLayout, config: Config, window: FluentWindow) -> None:
-
-        def init(widget: SpinCard) -> None:
-            widget.get_spin_box().setRange(0, 9999999)
-            widget.get_spin_box().setValue(config.rpm_threshold)
-
-        def value_changed(widget: SpinCard) -> None:
-            config = Config().load()
-            config.rpm_threshold = widget.get_spin_box().value()
-            config.save()
-
-        parent.addWidget(
-            SpinCard(
-                title = Localizer.get().basic_settings_page_rpm_threshold_title,
-                description = Localizer.get().basic_settings_page_rpm_threshold_content,
-                init = init,
-                value_changed = value_changed,
-            )
-        )
-
-    # 翻译任务长度阈值
-    def add_widget_token_threshold(self, parent: QLayout, config: Config, window: FluentWindow)-> None:
-
-        def init(widget: SpinCard) -> None:
-            widget.get_spin_box().setRange(0, 9999999)
-            widget.get_spin_box().setValue(config.token_threshold)
-
-        def value_changed(widget: SpinCard) -> None:
-            config = Config().load()
-            config.token_threshold = widget.get_spin_box().value()
-            config.save()
-
-        parent.addWidget(
-            SpinCard(
-                title = Localizer.get().basic_settings_page_token_threshold_title,
-                description = Localizer.get().basic_settings_page_token_threshold_content,
-                init = init,
-                value_changed = value_changed,
-            )
-        )
-
-    # 请求超时时间
-    def add_widget_request_timeout(self, parent: QLayout, config: Config, window: FluentWindow)-> None:
-
-        def init(widget: SpinCard) -> None:
-            widget.get_spin_box().setRange(0, 9999999)
-            widget.get_spin_box().setValue(config.request_timeout)
+    # 创建控件
+    def build_widgets(self, parent: QLayout, window: FluentWindow) -> None:
+        # 载入并保存默认配置
+        config = Config().load().ensure_saved_once()
 
-        def value_changed(widget: SpinCard) -> None:
-            config = Config().load()
-            config.request_timeout = widget.get_spin_box().value()
-            config.save()
+        # 批量添加期间暂停重绘，全部添加完成后只做一次布局与绘制
+        container = parent.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            # 添加控件
+            for attr, title_key, description_key in __class__.SPIN_CARDS:
+                self.add_widget_spin(parent, config, attr, title_key, description_key)
+            # 自定义提示词（可选）
 
-        parent.addWidget(
-            SpinCard(
-                title = Localizer.get().basic_settings_page_request_timeout_title,
-                description = Localizer.get().basic_settings_page_request_timeout_content,
-                init = init,
-                value_changed = value_changed,
-            )
-        )
+            # 填充
+            parent.addStretch(1)
+        finally:
+            container.setUpdatesEnabled(True)
 
-    # 翻译流程最大轮次
-    def add_widget_max_round(self, parent: QLayout, config: Config, window: FluentWindow)-> None:
+    # 数值设置卡片
+    def add_widget_spin(self, parent: QLayout, config: Config, attr: str, title_key: str, description_key: str) -> None:
 
         def init(widget: SpinCard) -> None:
             widget.get_spin_box().setRange(0, 9999999)
-            widget.get_spin_box().setValue(config.max_round)
+            widget.get_spin_box().setValue(getattr(config, attr))
 
         def value_changed(widget: SpinCard) -> None:
-            config = Config().load()
-            config.max_round = widget.get_spin_box().value()
-            config.save()
+            Config.schedule_save(**{attr: widget.get_spin_box().value()})
 
         parent.addWidget(
             SpinCard(
-                title = Localizer.get().basic_settings_page_max_round_title,
-                description = Localizer.get().basic_settings_page_max_round_content,
+                title = getattr(Localizer.get(), title_key),
+                description = getattr(Localizer.get(), description_key),
                 init = init,
                 value_changed = value_changed,
             )
@@ -1,4 +1,5 @@
 from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtWidgets import QLayout
 from PyQt5.QtWidgets import QVBoxLayout
@@ -15,12 +16,16 @@ from widget.SwitchButtonCard import SwitchButtonCard
 
 class CustomPromptPage(QWidget, Base):
 
+    # 提示词编辑停止输入多久后写盘（毫秒）
+    SAVE_DELAY_MS = 500
+
     def __init__(self, text: str, window: FluentWindow) -> None:
         super().__init__(window)
         self.setObjectName(text.replace(" ", "-"))
+        self.main_window = window
 
-        # 载入配置
-        config = Config().load().save()
+        # 提示词编辑框的延迟保存定时器，页面隐藏时立即落盘
+        self.save_timers: list[QTimer] = []
 
         # 容器
         self.root = QVBoxLayout(self)
@@ -38,13 +43,43 @@ class CustomPromptPage(QWidget, Base):
         scroll_area.enableTransparentBackground()
         self.root.addWidget(scroll_area)
 
-        # 自定义中文提示词
-        self.add_widget_custom_prompt_zh(scroll_area_vbox, config, window)
-        # 自定义英文提示词
-        self.add_widget_custom_prompt_en(scroll_area_vbox, config, window)
+        # 控件在页面首次显示时再创建，不拖慢主窗口启动
+        self.scroll_area_vbox = scroll_area_vbox
+        self.widgets_built = False
+
+    # 首次显示时创建控件
+    def showEvent(self, event) -> None:
+        if not self.widgets_built:
+            self.widgets_built = True
+            self.build_widgets(self.scroll_area_vbox, self.main_window)
+        super().showEvent(event)
 
-        # 填充
-        scroll_area_vbox.addStretch(1)
+    # 创建控件
+    def build_widgets(self, parent: QLayout, window: FluentWindow) -> None:
+        # 载入配置
+        config = Config().load().ensure_saved_once()
+
+        # 批量添加期间暂停重绘，全部添加完成后只做一次布局与绘制
+        container = parent.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            # 自定义中文提示词
+            self.add_widget_custom_prompt_zh(parent, config, window)
+            # 自定义英文提示词
+            self.add_widget_custom_prompt_en(parent, config, window)
+
+            # 填充
+            parent.addStretch(1)
+        finally:
+            container.setUpdatesEnabled(True)
+
+    # 页面隐藏时立即保存尚未落盘的修改
+    def hideEvent(self, event) -> None:
+        for timer in self.save_timers:
+            if timer.isActive():
+                timer.stop()
+                timer.timeout.emit()
+        super().hideEvent(event)
 
     # 自定义中文提示词
     def add_widget_custom_prompt_zh(self, parent: QLayout, config: Config, window: FluentWindow) -> None:
@@ -62,12 +97,19 @@ class CustomPromptPage(QWidget, Base):
             edit.setPlainText(config.custom_prompt_zh_data or "")
             edit.setPlaceholderText("在此粘贴或编写中文提示词主体（不含前缀/后缀）")
 
-            def on_changed():
+            def do_save() -> None:
                 cfg = Config().load()
                 cfg.custom_prompt_zh_data = edit.toPlainText()
                 cfg.save()
 
-            edit.textChanged.connect(on_changed)
+            # 输入过程中只重置定时器，停止输入后合并保存一次
+            save_timer = QTimer(edit)
+            save_timer.setSingleShot(True)
+            save_timer.setInterval(__class__.SAVE_DELAY_MS)
+            save_timer.timeout.connect(do_save)
+            self.save_timers.append(save_timer)
+
+            edit.textChanged.connect(save_timer.start)
             widget.add_widget(edit)
 
         parent.addWidget(
@@ -103,12 +145,19 @@ class CustomPromptPage(QWidget, Base):
             edit.setPlainText(config.custom_prompt_en_data or "")
             edit.setPlaceholderText("Write English prompt body here (without prefix/suffix)")
 
-            def on_changed():
+            def do_save() -> None:
                 cfg = Config().load()
                 cfg.custom_prompt_en_data = edit.toPlainText()
                 cfg.save()
 
-            edit.textChanged.connect(on_changed)
+            # 输入过程中只重置定时器，停止输入后合并保存一次
+            save_timer = QTimer(edit)
+            save_timer.setSingleShot(True)
+            save_timer.setInterval(__class__.SAVE_DELAY_MS)
+            save_timer.timeout.connect(do_save)
+            self.save_timers.append(save_timer)
+
+            edit.textChanged.connect(save_timer.start)
             widget.add_widget(edit)
 
         parent.addWidget(
@@ -18,7 +18,7 @@ class ExpertSettingsPage(QWidget, Base):
         self.setObjectName(text.replace(" ", "-"))
 
         # 载入并保存默认配置
-        config = Config().load().save()
+        config = Config().load().ensure_saved_once()
 
         # 设置容器
         self.root = QVBoxLayout(self)
@@ -141,7 +141,7 @@ class TranslationPage(QWidget, Base):
         }
 
         # 载入并保存默认配置
-        config = Config().load().save()
+        config = Config().load().ensure_saved_once()
 
         # 设置主容器
         self.container = QVBoxLayout(self)
@@ -1,5 +1,6 @@
 import dataclasses
 import re
+import sys
 import threading
 from base.compat import StrEnum, Self
 from typing import Any
@@ -60,6 +61,12 @@ class CacheItem():
     # 线程锁
     lock: threading.Lock = dataclasses.field(init = False, repr = False, compare = False, default_factory = threading.Lock)
 
+    # 自上次保存后是否被修改过（增量保存使用）
+    dirty: bool = dataclasses.field(init = False, repr = False, compare = False, default = False)
+
+    # 原文非空行数缓存，原文修改时失效
+    line_count: int = dataclasses.field(init = False, repr = False, compare = False, default = None)
+
     # WOLF
     REGEX_WOLF: ClassVar[tuple[re.Pattern]] = (
         re.compile(r"@\d+", flags = re.IGNORECASE),                                             # 角色 ID
@@ -86,7 +93,20 @@ class CacheItem():
         filtered_data = {k: v for k, v in data.items() if k in class_fields}
         return cls(**filtered_data)
 
+    # 浅拷贝：直接复制字段，不再经过 asdict/from_dict 重建（与原实现一样共享可变字段）
+    def __copy__(self) -> Self:
+        item = __class__.__new__(__class__)
+        with self.lock:
+            item.__dict__.update(self.__dict__)
+        item.lock = threading.Lock()
+        item.dirty = False
+        return item
+
     def __post_init__(self) -> None:
+        # 驻留文件路径，同一文件的条目共享同一个字符串对象，分块时的路径比较可以直接命中身份判断
+        if isinstance(self.file_path, str):
+            self.file_path = sys.intern(self.file_path)
+
         # 如果文件类型是 XLSX、TRANS、KVJSON、MESSAGEJSON，且没有文本类型，则判断实际的文本类型
         if (
             self.get_file_type() in (__class__.FileType.XLSX, __class__.FileType.KVJSON, __class__.FileType.MESSAGEJSON)
@@ -107,7 +127,9 @@ class CacheItem():
     # 设置原文
     def set_src(self, src: str) -> None:
         with self.lock:
+            self.dirty = True
             self.src = src
+            self.line_count = None
 
     # 获取译文
     def get_dst(self) -> str:
@@ -117,6 +139,7 @@ class CacheItem():
     # 设置译文
     def set_dst(self, dst: str) -> None:
         with self.lock:
+            self.dirty = True
             # 有时候模型的回复反序列化以后会是 int 等非字符类型，所以这里要强制转换成字符串
             # TODO:可能需要更好的处理方式
             if isinstance(dst, str):
@@ -132,6 +155,7 @@ class CacheItem():
     # 设置角色姓名原文
     def set_name_src(self, name_src: str | list[str]) -> None:
         with self.lock:
+            self.dirty = True
             self.name_src = name_src
 
     # 获取角色姓名译文
@@ -142,6 +166,7 @@ class CacheItem():
     # 设置角色姓名译文
     def set_name_dst(self, name_dst: str | list[str]) -> None:
         with self.lock:
+            self.dirty = True
             self.name_dst = name_dst
 
     # 获取额外字段原文
@@ -152,6 +177,7 @@ class CacheItem():
     # 设置额外字段原文
     def set_extra_field(self, extra_field: str | dict) -> None:
         with self.lock:
+            self.dirty = True
             self.extra_field = extra_field
 
     # 获取标签
@@ -162,6 +188,7 @@ class CacheItem():
     # 设置标签
     def set_tag(self, tag: str) -> None:
         with self.lock:
+            self.dirty = True
             self.tag = tag
 
     # 获取行号
@@ -172,6 +199,7 @@ class CacheItem():
     # 设置行号
     def set_row(self, row: int) -> None:
         with self.lock:
+            self.dirty = True
             self.row = row
 
     # 获取文件类型
@@ -182,6 +210,7 @@ class CacheItem():
     # 设置文件类型
     def set_file_type(self, type: FileType) -> None:
         with self.lock:
+            self.dirty = True
             self.file_type = type
 
     # 获取文件路径
@@ -192,7 +221,8 @@ class CacheItem():
     # 设置文件路径
     def set_file_path(self, path: str) -> None:
         with self.lock:
-            self.file_path = path
+            self.dirty = True
+            self.file_path = sys.intern(path) if isinstance(path, str) else path
 
     # 获取文本类型
     def get_text_type(self) -> TextType:
@@ -202,6 +232,7 @@ class CacheItem():
     # 设置文本类型
     def set_text_type(self, type: TextType) -> None:
         with self.lock:
+            self.dirty = True
             self.text_type = type
 
     # 获取翻译状态
@@ -212,6 +243,7 @@ class CacheItem():
     # 设置翻译状态
     def set_status(self, status: Base.TranslationStatus) -> None:
         with self.lock:
+            self.dirty = True
             self.status = status
 
     # 获取重试次数
@@ -222,6 +254,7 @@ class CacheItem():
     # 设置重试次数
     def set_retry_count(self, retry_count: int) -> None:
         with self.lock:
+            self.dirty = True
             self.retry_count = retry_count
 
     def asdict(self) -> dict[str, Any]:
@@ -232,6 +265,15 @@ class CacheItem():
                 if v.init != False
             }
 
+    # 获取原文非空行数
+    def get_line_count(self) -> int:
+        with self.lock:
+            if self.line_count is None:
+                # 原文可能为 None（例如缓存文件中的 null），按 0 行处理
+                src_text = self.src
+                self.line_count = sum(1 for line in src_text.splitlines() if line.strip()) if src_text else 0
+            return self.line_count
+
     # 获取 Token 数量
     def get_token_count(self) -> int:
         return len(tiktoken.get_encoding("o200k_base").encode(self.get_src()))
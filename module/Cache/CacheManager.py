@@ -2,17 +2,51 @@ import os
 import time
 import json
 import threading
+from typing import Any
 
 from base.Base import Base
 from module.Cache.CacheItem import CacheItem
 from module.Cache.CacheProject import CacheProject
 from module.Localizer.Localizer import Localizer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 解析 JSON 字节串，可用时使用 orjson（直接解析字节，兼容 BOM）
+def _load_json_bytes(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data.removeprefix(b"\xef\xbb\xbf"))
+    return json.loads(data.decode("utf-8-sig"))
+
+# 读取文件的全部字节，文件不存在时返回 None
+def _read_bytes(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as reader:
+            return reader.read()
+    except FileNotFoundError:
+        return None
+
+# 解析一行 JSON
+def _load_json_line(line: bytes) -> Any:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+# 序列化为一行 JSON
+def _dump_json_line(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option = orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(data, ensure_ascii = False, separators = (",", ":")).encode("utf-8") + b"\n"
+
 class CacheManager(Base):
 
     # 缓存文件保存周期（秒）
     SAVE_INTERVAL = 15
 
+    # 增量日志累计条数或距上次完整保存的时间（秒）超过阈值时，合并为完整快照
+    COMPACT_EVERY = 5000
+    COMPACT_INTERVAL = 300
+
     # 结尾标点符号
     END_LINE_PUNCTUATION = (
         ".",
@@ -30,8 +64,12 @@ class CacheManager(Base):
         "』",
     )
 
-    # 类线程锁
-    LOCK = threading.Lock()
+    # 结尾标点均为单个字符，末字符查集合比 endswith 逐个比较元组更快
+    END_LINE_CHARS = frozenset(END_LINE_PUNCTUATION)
+
+    # 类线程锁：条目文件（快照与增量日志）与项目文件各用一把，互不阻塞
+    ITEMS_LOCK = threading.Lock()
+    PROJECT_LOCK = threading.Lock()
 
     def __init__(self, service: bool) -> None:
         super().__init__()
@@ -45,6 +83,15 @@ class CacheManager(Base):
         self.require_path: str = ""
         self.last_require_time: float = 0
 
+        # 增量保存：已有完整快照的输出目录、快照之后写入日志的条数与完整保存时间
+        self.save_lock = threading.Lock()
+        self.snapshot_folder: str = None
+        self.journal_count: int = 0
+        self.last_compact_time: float = 0
+
+        # 定时任务的唤醒事件：有保存请求时才唤醒，空闲时不轮询
+        self.require_event = threading.Event()
+
         # 启动定时任务
         if service == True:
             threading.Thread(
@@ -54,73 +101,192 @@ class CacheManager(Base):
     # 保存缓存到文件的定时任务
     def task(self) -> None:
         while True:
-            # 休眠 1 秒
-            time.sleep(1.00)
+            # 等待保存请求
+            self.require_event.wait()
+
+            # 距上次保存不足保存周期时等待剩余时间
+            remaining = __class__.SAVE_INTERVAL - (time.time() - self.last_require_time)
+            if remaining > 0:
+                time.sleep(remaining)
+
+            # 期间已经保存过（例如停止翻译时的手动保存）则无需再写
+            # 先清除事件与标志再保存，保存期间到达的新请求会在下一轮处理
+            self.require_event.clear()
+            if self.require_flag == False:
+                continue
+            self.require_flag = False
 
-            if (
-                time.time() - self.last_require_time >= __class__.SAVE_INTERVAL
-                and self.require_flag == True
-            ):
-                # 创建上级文件夹
-                folder_path = f"{self.require_path}/cache"
-                os.makedirs(folder_path, exist_ok = True)
+            # 创建上级文件夹
+            folder_path = f"{self.require_path}/cache"
+            os.makedirs(folder_path, exist_ok = True)
 
-                # 保存缓存到文件
+            # 已有完整快照时只追加变化的条目，达到阈值后再合并为完整快照
+            if self.can_append_journal(self.require_path):
+                self.append_to_journal(
+                    project = self.project,
+                    items = self.items,
+                    output_folder = self.require_path,
+                )
+            else:
                 self.save_to_file(
                     project = self.project,
                     items = self.items,
                     output_folder = self.require_path,
                 )
 
-                # 触发事件
-                self.emit(Base.Event.CACHE_FILE_AUTO_SAVE, {})
+            # 触发事件
+            self.emit(Base.Event.CACHE_FILE_AUTO_SAVE, {})
 
-                # 重置标志
-                self.require_flag = False
-                self.last_require_time = time.time()
+            # 记录保存时间
+            self.last_require_time = time.time()
 
     # 保存缓存到文件
     def save_to_file(self, project: CacheProject, items: list[CacheItem], output_folder: str) -> None:
         # 创建上级文件夹
         os.makedirs(f"{output_folder}/cache", exist_ok = True)
 
-        # 保存缓存到文件
-        path = f"{output_folder}/cache/items.json"
-        with __class__.LOCK:
+        with self.save_lock:
+            # 重置标志，保存开始后到达的新请求仍会被定时任务处理
+            self.require_flag = False
+
+            # 先清除修改标记再序列化，序列化期间发生的修改会在下一次保存时写入
+            dirty_items = [item for item in items if item.dirty]
+            for item in dirty_items:
+                item.dirty = False
+
+            # 保存缓存到文件（JSON Lines，每行一个条目）
+            # 同时写出旧版本读取的 items.json（JSON 数组），降级或旧版本打开同一项目时仍能读到完整快照时的进度
+            # 先在锁外写入临时文件，锁内只做原子替换，缩短读取方的等待时间，写入中途崩溃也不会损坏原文件
+            path = f"{output_folder}/cache/items.jsonl"
+            legacy_path = f"{output_folder}/cache/items.json"
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            legacy_temp_path = f"{legacy_path}.{threading.get_ident()}.tmp"
             try:
-                with open(path, "w", encoding = "utf-8") as writer:
-                    # 逐条写入以避免一次性构建超大字符串导致 UI 卡顿（线程持有 GIL 时间过长）
-                    writer.write("[")
-                    for i, item in enumerate(items):
-                        if i > 0:
-                            writer.write(",")
-                        json.dump(item.asdict(), writer, ensure_ascii = False, separators = (",", ":"))
-
-                        # 适当让出执行权，提升停止/切换页面时的响应速度
-                        if i % 200 == 0:
-                            writer.flush()
-                            time.sleep(0)
-                    writer.write("]")
+                records = [item.asdict() for item in items]
+                if orjson is not None:
+                    # orjson 在 C 层完成序列化，比逐条 json.dump 快得多
+                    with open(temp_path, "wb") as writer:
+                        writer.write(b"".join(_dump_json_line(record) for record in records))
+                    with open(legacy_temp_path, "wb") as writer:
+                        writer.write(orjson.dumps(records, option = orjson.OPT_NON_STR_KEYS))
+                else:
+                    self.write_items_jsonl(temp_path, records)
+                    self.write_items_json(legacy_temp_path, records)
+                with __class__.ITEMS_LOCK:
+                    os.replace(temp_path, path)
+                    os.replace(legacy_temp_path, legacy_path)
+
+                    # 完整快照已包含全部修改，删除增量日志
+                    journal_path = f"{output_folder}/cache/items.log.jsonl"
+                    if os.path.isfile(journal_path):
+                        os.remove(journal_path)
+
+                self.snapshot_folder = output_folder
+                self.journal_count = 0
+                self.last_compact_time = time.time()
             except Exception as e:
+                # 写入失败时恢复修改标记，并作废已有快照，使下一次保存重新完整写入
+                self.restore_dirty(dirty_items)
+                for stale_path in (temp_path, legacy_temp_path):
+                    try:
+                        os.remove(stale_path)
+                    except OSError:
+                        pass
                 self.debug(Localizer.get().log_write_cache_file_fail, e)
 
-        # 保存项目数据到文件
-        path = f"{output_folder}/cache/project.json"
-        with __class__.LOCK:
-            try:
-                with open(path, "w", encoding = "utf-8") as writer:
-                    writer.write(json.dumps(project.asdict(), indent = None, ensure_ascii = False))
-            except Exception as e:
-                self.debug(Localizer.get().log_write_cache_file_fail, e)
+            # 保存项目数据到文件
+            self.save_project_to_file(project, output_folder)
 
-        # 重置标志
-        self.require_flag = False
+        # 记录保存时间
         self.last_require_time = time.time()
 
+    # 写入失败时恢复修改标记，并作废已有快照（日志可能只写入了一部分），下一次保存重新完整写入
+    def restore_dirty(self, dirty_items: list[CacheItem]) -> None:
+        for item in dirty_items:
+            item.dirty = True
+        self.snapshot_folder = None
+
+    # 是否可以只追加增量日志
+    def can_append_journal(self, output_folder: str) -> bool:
+        return (
+            self.snapshot_folder == output_folder
+            and self.journal_count < __class__.COMPACT_EVERY
+            and time.time() - self.last_compact_time < __class__.COMPACT_INTERVAL
+        )
+
+    # 将快照之后修改过的条目追加到增量日志（每行 {"index": 序号, "item": 条目}）
+    def append_to_journal(self, project: CacheProject, items: list[CacheItem], output_folder: str) -> None:
+        with self.save_lock:
+            lines: list[bytes] = []
+            dirty_items: list[CacheItem] = []
+            for i, item in enumerate(items):
+                if item.dirty:
+                    item.dirty = False
+                    dirty_items.append(item)
+                    lines.append(_dump_json_line({"index": i, "item": item.asdict()}))
+
+            if len(lines) > 0:
+                path = f"{output_folder}/cache/items.log.jsonl"
+                with __class__.ITEMS_LOCK:
+                    try:
+                        with open(path, "ab") as writer:
+                            writer.write(b"".join(lines))
+                        self.journal_count = self.journal_count + len(lines)
+                    except Exception as e:
+                        self.restore_dirty(dirty_items)
+                        self.debug(Localizer.get().log_write_cache_file_fail, e)
+
+            # 保存项目数据到文件
+            self.save_project_to_file(project, output_folder)
+
+    # 保存项目数据到文件
+    def save_project_to_file(self, project: CacheProject, output_folder: str) -> None:
+        path = f"{output_folder}/cache/project.json"
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if orjson is not None:
+                with open(temp_path, "wb") as writer:
+                    writer.write(orjson.dumps(project.asdict(), option = orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(temp_path, "w", encoding = "utf-8") as writer:
+                    writer.write(json.dumps(project.asdict(), indent = None, ensure_ascii = False))
+            with __class__.PROJECT_LOCK:
+                os.replace(temp_path, path)
+        except Exception as e:
+            self.debug(Localizer.get().log_write_cache_file_fail, e)
+
+    # 使用标准库逐条写入缓存条目（未安装 orjson 时使用）
+    def write_items_jsonl(self, path: str, records: list[dict]) -> None:
+        with open(path, "wb") as writer:
+            # 逐条写入以避免一次性构建超大字符串导致 UI 卡顿（线程持有 GIL 时间过长）
+            for i, record in enumerate(records):
+                writer.write(_dump_json_line(record))
+
+                # 适当让出执行权，提升停止/切换页面时的响应速度
+                if i % 200 == 0:
+                    writer.flush()
+                    time.sleep(0)
+
+    # 使用标准库逐条写入旧版本格式的 JSON 数组（未安装 orjson 时使用）
+    def write_items_json(self, path: str, records: list[dict]) -> None:
+        with open(path, "w", encoding = "utf-8") as writer:
+            writer.write("[")
+            for i, record in enumerate(records):
+                if i > 0:
+                    writer.write(",")
+                json.dump(record, writer, ensure_ascii = False, separators = (",", ":"))
+
+                # 适当让出执行权，提升停止/切换页面时的响应速度
+                if i % 200 == 0:
+                    writer.flush()
+                    time.sleep(0)
+            writer.write("]")
+
     # 请求保存缓存到文件
     def require_save_to_file(self, output_path: str) -> None:
         self.require_flag = True
         self.require_path = output_path
+        self.require_event.set()
 
     # 从文件读取数据
     def load_from_file(self, output_path: str) -> None:
@@ -129,30 +295,76 @@ class CacheManager(Base):
 
     # 从文件读取项目数据
     def load_items_from_file(self, output_path: str) -> None:
-        path = f"{output_path}/cache/items.json"
-        with __class__.LOCK:
+        # 锁内只读取快照与增量日志的原始字节：日志是原地追加、合并快照时删除的，
+        # 两者必须在同一把锁下读取才能保证配套；耗时的解析与重放放在锁外，完成后一次性替换 items
+        try:
+            with __class__.ITEMS_LOCK:
+                data = _read_bytes(f"{output_path}/cache/items.jsonl")
+                legacy = data is None
+                if legacy:
+                    # 兼容旧版本保存的 JSON 数组
+                    data = _read_bytes(f"{output_path}/cache/items.json")
+                journal = _read_bytes(f"{output_path}/cache/items.log.jsonl") if data is not None else None
+        except Exception as e:
+            self.debug(Localizer.get().log_read_cache_file_fail, e)
+            return
+
+        if data is None:
+            return
+
+        try:
+            if legacy:
+                items = [CacheItem.from_dict(item) for item in _load_json_bytes(data)]
+            else:
+                items = [CacheItem.from_dict(_load_json_line(line)) for line in data.splitlines() if line.strip()]
+            journal_count = self.replay_journal(items, journal) if journal is not None else 0
+            for item in items:
+                item.dirty = False
+        except Exception as e:
+            self.debug(Localizer.get().log_read_cache_file_fail, e)
+            return
+
+        self.items = items
+        self.journal_count = journal_count
+        self.snapshot_folder = output_path
+        self.last_compact_time = time.time()
+
+    # 在快照之上重放增量日志，返回重放的条数
+    def replay_journal(self, items: list[CacheItem], journal: bytes) -> int:
+        count = 0
+        for line in journal.splitlines():
             try:
-                if os.path.isfile(path):
-                    with open(path, "r", encoding = "utf-8-sig") as reader:
-                        self.items = [CacheItem.from_dict(item) for item in json.load(reader)]
-            except Exception as e:
-                self.debug(Localizer.get().log_read_cache_file_fail, e)
+                record = _load_json_line(line)
+            except ValueError:
+                # 写入中途崩溃时最后一行可能不完整，直接跳过
+                continue
+
+            index = record.get("index", -1)
+            if 0 <= index < len(items):
+                items[index] = CacheItem.from_dict(record.get("item", {}))
+                count = count + 1
+
+        return count
 
     # 从文件读取项目数据
     def load_project_from_file(self, output_path: str) -> None:
         path = f"{output_path}/cache/project.json"
-        with __class__.LOCK:
-            try:
-                if os.path.isfile(path):
-                    with open(path, "r", encoding = "utf-8-sig") as reader:
-                        self.project = CacheProject.from_dict(json.load(reader))
-            except Exception as e:
-                self.debug(Localizer.get().log_read_cache_file_fail, e)
+        try:
+            # 项目文件整体原子替换，锁内只读取字节，解析放在锁外
+            with __class__.PROJECT_LOCK:
+                data = _read_bytes(path)
+            if data is not None:
+                self.project = CacheProject.from_dict(_load_json_bytes(data))
+        except Exception as e:
+            self.debug(Localizer.get().log_read_cache_file_fail, e)
 
     # 设置缓存数据
     def set_items(self, items: list[CacheItem]) -> None:
         self.items = items
 
+        # 新数据尚无完整快照，下一次保存需要完整写入
+        self.snapshot_folder = None
+
     # 获取缓存数据
     def get_items(self) -> list[CacheItem]:
         return self.items
@@ -171,7 +383,7 @@ class CacheManager(Base):
 
     # 复制缓存数据
     def copy_items(self) -> list[CacheItem]:
-        return [CacheItem.from_dict(item.asdict()) for item in self.items]
+        return [item.__copy__() for item in self.items]
 
     # 获取缓存数据数量（根据翻译状态）
     def get_item_count_by_status(self, status: int) -> int:
@@ -183,16 +395,20 @@ class CacheManager(Base):
         将所有"译文等于原文"的已翻译条目重置为未翻译状态
         返回重置的条目数量
         """
+        translated = Base.TranslationStatus.TRANSLATED
+        untranslated = Base.TranslationStatus.UNTRANSLATED
+
         count = 0
         for item in self.items:
-            if item.get_status() == Base.TranslationStatus.TRANSLATED:
-                src = (item.get_src() or "").strip()
-                dst = (item.get_dst() or "").strip()
-                if src and dst and src == dst:
-                    item.set_status(Base.TranslationStatus.UNTRANSLATED)
-                    item.set_dst("")
-                    item.set_retry_count(0)
-                    count += 1
+            # 只读判断直接访问字段，避免每条数据多次加锁调用 getter，命中的条目仍通过 setter 修改
+            if item.status != translated:
+                continue
+            src = (item.src or "").strip()
+            if src and src == (item.dst or "").strip():
+                item.set_status(untranslated)
+                item.set_dst("")
+                item.set_retry_count(0)
+                count += 1
         return count
 
     # 生成缓存数据条目片段
@@ -200,33 +416,37 @@ class CacheManager(Base):
         # 直接使用行数阈值
         line_limit = max(1, line_threshold)
 
+        untranslated = Base.TranslationStatus.UNTRANSLATED
+        translated = Base.TranslationStatus.TRANSLATED
+
         skip: int = 0
         line_length: int = 0
         chunk: list[CacheItem] = []
+        chunk_file_path: str = None
         chunks: list[list[CacheItem]] = []
         preceding_chunks: list[list[CacheItem]] = []
         for i, item in enumerate(self.items):
             # 跳过状态不是 未翻译 的数据
-            if item.get_status() != Base.TranslationStatus.UNTRANSLATED:
+            if item.get_status() != untranslated:
                 skip = skip + 1
                 continue
 
-            # 跳过源文本为空或只有空白字符的条目，并标记为已翻译（空翻译）
-            src_text = item.get_src()
-            if not src_text or not src_text.strip():
+            # 跳过源文本为空或只有空白字符的条目（非空行数为 0），并标记为已翻译（空翻译）
+            current_line_length = item.get_line_count()
+            if current_line_length == 0:
                 item.set_dst("")  # 设置空翻译
-                item.set_status(Base.TranslationStatus.TRANSLATED)  # 标记为已翻译
+                item.set_status(translated)  # 标记为已翻译
                 skip = skip + 1
                 continue
 
             # 每个片段的第一条不判断是否超限，以避免特别长的文本导致死循环
-            current_line_length = sum(1 for line in src_text.splitlines() if line.strip())
+            file_path = item.get_file_path()
             if len(chunk) == 0:
                 pass
             # 如果 行数超限 或 数据来源跨文件，则结束此片段
             elif (
                 line_length + current_line_length > line_limit
-                or item.get_file_path() != chunk[-1].get_file_path()
+                or file_path != chunk_file_path
             ):
                 chunks.append(chunk)
                 preceding_chunks.append(self.generate_preceding_chunks(chunk, i, skip, preceding_lines_threshold))
@@ -236,6 +456,7 @@ class CacheManager(Base):
                 line_length = 0
 
             chunk.append(item)
+            chunk_file_path = file_path
             line_length = line_length + current_line_length
 
         # 如果还有剩余数据，则添加到列表中
@@ -249,6 +470,7 @@ class CacheManager(Base):
     # 生成参考上文数据条目片段
     def generate_preceding_chunks(self, chunk: list[CacheItem], start: int, skip: int, preceding_lines_threshold: int) -> list[list[CacheItem]]:
         result: list[CacheItem] = []
+        file_path = chunk[-1].get_file_path()
 
         for i in range(start - skip - len(chunk) - 1, -1, -1):
             item = self.items[i]
@@ -267,11 +489,11 @@ class CacheManager(Base):
                 break
 
             # 候选数据与当前任务不在同一个文件时，结束搜索
-            if item.get_file_path() != chunk[-1].get_file_path():
+            if item.get_file_path() != file_path:
                 break
 
-            # 候选数据以指定标点结尾时，添加到结果中
-            if src.endswith(__class__.END_LINE_PUNCTUATION):
+            # 候选数据以指定标点结尾时，添加到结果中（src 此时必然非空）
+            if src[-1] in __class__.END_LINE_CHARS:
                 result.append(item)
             else:
                 break
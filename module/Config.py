@@ -1,4 +1,5 @@
 import dataclasses
+import hashlib
 import json
 import os
 import threading
@@ -132,8 +133,23 @@ class Config():
     CONFIG_PATH: ClassVar[str] = "./config.json"
     CONFIG_LOCK: ClassVar[threading.Lock] = threading.Lock()
 
+    # 延迟合并保存：短时间内的多次字段修改只读写一次配置文件
+    SAVE_DELAY: ClassVar[float] = 0.5
+    PENDING_LOCK: ClassVar[threading.RLock] = threading.RLock()
+    PENDING_CHANGES: ClassVar[dict[str, Any]] = {}
+    PENDING_TIMER: ClassVar[threading.Timer] = None
+
+    # 每个路径最近一次写出内容的摘要与文件状态 (digest, mtime_ns, size)，内容未变化时跳过写盘
+    SAVED_DIGESTS: ClassVar[dict[str, tuple[bytes, int, int]]] = {}
+
+    # 本进程是否已写出过一次完整配置（补齐新增字段的默认值）
+    SAVED_ONCE: ClassVar[bool] = False
+
     def load(self, path: str = None) -> Self:
         if path is None:
+            # 先落盘尚未写入的延迟修改，保证读到最新值
+            if __class__.PENDING_CHANGES:
+                __class__.flush_pending()
             user_path = __class__.CONFIG_PATH
             path = user_path if os.path.isfile(user_path) else get_resource_path("resource", "config.json")
 
@@ -150,20 +166,83 @@ class Config():
 
         return self
 
-    def save(self, path: str = None) -> Self:
+    # pretty 为 False 时写出紧凑 JSON（自动保存频繁，紧凑格式体积约减半），需要人工阅读时传 True
+    def save(self, path: str = None, pretty: bool = False) -> Self:
         if path is None:
             path = __class__.CONFIG_PATH
 
-        with __class__.CONFIG_LOCK:
-            try:
-                os.makedirs(os.path.dirname(path), exist_ok = True)
-                with open(path, "w", encoding = "utf-8") as writer:
-                    json.dump(dataclasses.asdict(self), writer, indent = 4, ensure_ascii = False)
-            except Exception as e:
-                LogManager.get().error(f"{Localizer.get().log_write_file_fail}", e)
+        # 序列化与写临时文件在锁外进行，锁内只做比较与原子替换，不阻塞其他线程读取配置
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+            data = dataclasses.asdict(self)
+            if pretty == True:
+                payload = json.dumps(data, indent = 4, ensure_ascii = False).encode("utf-8")
+            else:
+                payload = json.dumps(data, separators = (",", ":"), ensure_ascii = False).encode("utf-8")
+
+            # 与上次写出的内容相同且文件未被外部修改时跳过
+            digest = hashlib.blake2b(payload, digest_size = 16).digest()
+            with __class__.CONFIG_LOCK:
+                saved = __class__.SAVED_DIGESTS.get(path)
+                if saved is not None and saved[0] == digest and os.path.isfile(path):
+                    stat = os.stat(path)
+                    if (stat.st_mtime_ns, stat.st_size) == saved[1:]:
+                        return self
+
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as writer:
+                writer.write(payload)
+
+            with __class__.CONFIG_LOCK:
+                os.replace(temp_path, path)
+                stat = os.stat(path)
+                __class__.SAVED_DIGESTS[path] = (digest, stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            # 写入或替换失败时清理临时文件，避免残留在 config.json 旁边
+            if temp_path is not None and os.path.isfile(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            LogManager.get().error(f"{Localizer.get().log_write_file_fail}", e)
 
         return self
 
+    # 每个进程只写出一次完整配置，用于首次运行生成用户配置与补齐新增字段，之后打开页面不再重复写盘
+    def ensure_saved_once(self) -> Self:
+        if not __class__.SAVED_ONCE:
+            __class__.SAVED_ONCE = True
+            self.save()
+
+        return self
+
+    # 登记字段修改，延迟 SAVE_DELAY 秒后合并写盘，期间再次修改会重新计时
+    @classmethod
+    def schedule_save(cls, **changes: Any) -> None:
+        with cls.PENDING_LOCK:
+            cls.PENDING_CHANGES.update(changes)
+            if cls.PENDING_TIMER is not None:
+                cls.PENDING_TIMER.cancel()
+            cls.PENDING_TIMER = threading.Timer(cls.SAVE_DELAY, cls.flush_pending)
+            cls.PENDING_TIMER.start()
+
+    # 立即写入所有待保存的字段修改（读取最新配置后再应用，避免覆盖其他页面的修改）
+    @classmethod
+    def flush_pending(cls) -> None:
+        with cls.PENDING_LOCK:
+            if cls.PENDING_TIMER is not None:
+                cls.PENDING_TIMER.cancel()
+                cls.PENDING_TIMER = None
+            changes, cls.PENDING_CHANGES = cls.PENDING_CHANGES, {}
+            if not changes:
+                return
+
+            config = cls().load()
+            for k, v in changes.items():
+                setattr(config, k, v)
+            config.save()
+
     # 重置专家模式
     def reset_expert_settings(self) -> None:
         # ExpertSettingsPage
@@ -181,14 +260,31 @@ class Config():
 
     # 获取平台配置
     def get_platform(self, id: int) -> dict[str, Any]:
-        item: dict[str, str | bool | int | float | list[str]] = None
-        for item in self.platforms:
-            if item.get("id", 0) == id:
-                return item
+        i = self.find_platform_index(id)
+        return self.platforms[i] if i is not None else None
 
     # 更新平台配置
     def set_platform(self, platform: dict[str, Any]) -> None:
-        for i, item in enumerate(self.platforms):
-            if item.get("id", 0) == platform.get("id", 0):
-                self.platforms[i] = platform
-                break
+        i = self.find_platform_index(platform.get("id", 0))
+        if i is not None:
+            self.platforms[i] = platform
+
+    # 查找平台在列表中的位置：使用 id -> 位置 缓存，命中后校验，列表被直接修改导致缓存失效时重建
+    # 缓存不是 dataclass 字段，不会被写入配置文件
+    def find_platform_index(self, id: int) -> int | None:
+        platforms = self.platforms or []
+        positions: dict[int, int] = self.__dict__.get("_platform_positions")
+        for rebuild in (False, True):
+            if rebuild:
+                positions = {}
+                for i, item in enumerate(platforms):
+                    positions.setdefault(item.get("id", 0), i)
+                self._platform_positions = positions
+            elif positions is None:
+                continue
+
+            i = positions.get(id)
+            if i is not None and i < len(platforms) and platforms[i].get("id", 0) == id:
+                return i
+
+        return None
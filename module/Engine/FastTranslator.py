@@ -6,11 +6,15 @@
 import os
 import re
 import concurrent.futures
+import threading
 import traceback
+from collections import OrderedDict
 from typing import List, Dict, Optional, Any, Tuple
 
 try:
     from pygtrans import Translate
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     PYGTRANS_AVAILABLE = True
 except ImportError:
     PYGTRANS_AVAILABLE = False
@@ -51,6 +55,16 @@ class FastTranslator:
         r'<[^>]+>',            # <b>, </b>, <color=#fff> HTML标签
     ]
     _PLACEHOLDER_RE = re.compile('|'.join(PLACEHOLDER_PATTERNS))
+    # 预先生成的占位符标记（使用中文括号作为标记，不太可能被翻译），超出部分再现场格式化
+    _PLACEHOLDER_MARKERS = tuple(f"\u3010PH{i:03d}\u3011" for i in range(64))
+
+    # 翻译结果 LRU 缓存：(引擎, 源语言, 目标语言, 保护后的原文) -> 译文，进程内各实例共享
+    CACHE_MAX_SIZE = 50000
+    _CACHE: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+    _CACHE_LOCK = threading.Lock()
+
+    # Google 单次请求的文本总长度上限（pygtrans 把整个列表放进一次 POST，过大会被拒绝）
+    GOOGLE_MAX_CHARS = 4500
     
     # 语言代码映射
     LANG_MAP = {
@@ -78,6 +92,7 @@ class FastTranslator:
         self._client = None
         self._google_failed = False  # 标记 Google 是否连接失败
         self._google_timeout = 15
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None  # translators 并发翻译线程池，首次使用时创建
         
         # 从配置读取代理
         if proxies is None:
@@ -87,9 +102,40 @@ class FastTranslator:
         # 初始化客户端
         if self.engine == 'google' and PYGTRANS_AVAILABLE:
             self._client = Translate(fmt='text', proxies=proxies, timeout=self._google_timeout, trust_env=True)
+            self._mount_connection_pool(self._client.session)
         elif not TRANSLATORS_AVAILABLE and self.engine != 'google':
             self.logger.warning(f"translators 库不可用，{self.engine} 引擎可能无法工作")
     
+    def close(self) -> None:
+        """释放并发翻译线程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def __del__(self):
+        self.close()
+    
+    @staticmethod
+    def _mount_connection_pool(session) -> None:
+        """
+        为 requests 会话挂载更大的长连接池与连接级重试，连续批次复用已建立的 TLS 连接
+        429 由 pygtrans 自行退避重试，这里只处理网关错误
+        urllib3 默认不对 POST 做状态码重试，而 pygtrans 以 POST 提交翻译（只读、可安全重发），需显式加入
+        """
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=100,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    
     def _load_proxy_from_config(self) -> Optional[Dict]:
         """从配置文件读取代理设置"""
         try:
@@ -122,18 +168,23 @@ class FastTranslator:
         Returns:
             (替换后的文本, [(标记, 原始占位符)...])
         """
+        # 大多数对话行没有占位符，先做一次 C 层搜索直接返回
+        if not self._PLACEHOLDER_RE.search(text):
+            return text, []
+
+        markers = self._PLACEHOLDER_MARKERS
         placeholders = []
-        counter = [0]  # 用列表以便在内部函数中修改
-        
-        def replace_func(match):
-            original = match.group(0)
-            marker = f"\u3010PH{counter[0]:03d}\u3011"  # 使用中文括号作为标记，不太可能被翻译
-            placeholders.append((marker, original))
-            counter[0] += 1
-            return marker
-        
-        protected_text = self._PLACEHOLDER_RE.sub(replace_func, text)
-        return protected_text, placeholders
+        parts = []
+        last = 0
+        for i, match in enumerate(self._PLACEHOLDER_RE.finditer(text)):
+            marker = markers[i] if i < len(markers) else f"\u3010PH{i:03d}\u3011"
+            placeholders.append((marker, match.group(0)))
+            parts.append(text[last:match.start()])
+            parts.append(marker)
+            last = match.end()
+        parts.append(text[last:])
+
+        return ''.join(parts), placeholders
     
     def _restore_placeholders(self, text: str, placeholders: List[Tuple[str, str]]) -> str:
         """
@@ -204,38 +255,79 @@ class FastTranslator:
         # 1. 保护占位符
         protected_texts, all_placeholders = self._protect_batch(texts)
         
-        # 2. 执行翻译
+        # 2. 命中缓存的直接取用，未命中的去重后再翻译
+        keys = [(self.engine, source_code, target_code, text) for text in protected_texts]
+        translated_map: Dict[Tuple[str, str, str, str], str] = {}
+        with self._CACHE_LOCK:
+            for key in keys:
+                cached = self._CACHE.get(key)
+                if cached is not None:
+                    self._CACHE.move_to_end(key)
+                    translated_map[key] = cached
+
+        miss_texts = list(dict.fromkeys(key[3] for key in keys if key not in translated_map))
+        if miss_texts:
+            miss_translated = self._translate_protected(miss_texts, target_code, source_code, max_batch_size)
+            with self._CACHE_LOCK:
+                for src, dst in zip(miss_texts, miss_translated):
+                    key = (self.engine, source_code, target_code, src)
+                    translated_map[key] = dst
+                    # 译文与原文相同多半是请求失败，不写入缓存，下次仍会重新翻译
+                    if dst and dst != src:
+                        self._CACHE[key] = dst
+                        self._CACHE.move_to_end(key)
+                while len(self._CACHE) > self.CACHE_MAX_SIZE:
+                    self._CACHE.popitem(last=False)
+
+        translated = [translated_map.get(key, key[3]) for key in keys]
+        
+        # 3. 还原占位符
+        return self._restore_batch(translated, all_placeholders)
+    
+    def _translate_protected(
+        self,
+        texts: List[str],
+        target: str,
+        source: str,
+        max_batch_size: Optional[int] = None,
+    ) -> List[str]:
+        """按引擎翻译已保护占位符的文本，Google 全部失败时自动切换到 translators"""
         if self.engine == 'google' and not self._google_failed:
-            translated = self._translate_google(protected_texts, target_code, source_code)
+            translated = self._translate_google(texts, target, source, max_batch_size)
             # 如果 Google 翻译全部失败（返回原文），尝试 Bing
-            if translated == protected_texts and TRANSLATORS_AVAILABLE:
+            if translated == texts and TRANSLATORS_AVAILABLE:
                 self.logger.warning("Google 翻译失败，自动切换到 Bing 翻译")
                 self._google_failed = True
                 translated = self._translate_with_translators(
-                    protected_texts,
-                    target_code,
-                    source_code,
+                    texts,
+                    target,
+                    source,
                     max_batch_size,
                 )
         elif self._google_failed or self.engine != 'google':
             translated = self._translate_with_translators(
-                protected_texts,
-                target_code,
-                source_code,
+                texts,
+                target,
+                source,
                 max_batch_size,
             )
         else:
             translated = self._translate_with_translators(
-                protected_texts,
-                target_code,
-                source_code,
+                texts,
+                target,
+                source,
                 max_batch_size,
             )
         
-        # 3. 还原占位符
-        return self._restore_batch(translated, all_placeholders)
+        return translated
     
-    def _translate_google(self, texts: List[str], target: str, source: str) -> List[str]:
+    def _translate_google(
+        self,
+        texts: List[str],
+        target: str,
+        source: str,
+        max_batch_size: Optional[int] = None,
+    ) -> List[str]:
         """
         使用 pygtrans 进行 Google 翻译
         pygtrans 原生支持批量翻译，速度极快
@@ -244,28 +336,51 @@ class FastTranslator:
             self.logger.error("pygtrans 不可用，请安装: pip install pygtrans")
             return texts
         
+        translated: List[str] = []
         try:
-            # pygtrans 的 translate 方法支持列表输入
-            results = self._client.translate(texts, target=target, source=source, timeout=self._google_timeout)
-            
-            if isinstance(results, list):
-                translated = []
-                for i, item in enumerate(results):
-                    if hasattr(item, 'translatedText') and item.translatedText:
-                        translated.append(item.translatedText)
-                    else:
-                        # 翻译失败，使用原文
-                        translated.append(texts[i] if i < len(texts) else '')
-                return translated
-            else:
-                self.logger.error(f"Google 翻译返回格式异常: {type(results)}")
-                return texts
-                
+            for chunk in self._chunk_google_texts(texts):
+                # pygtrans 的列表输入在一次 POST 中提交整组文本
+                results = self._client.translate(chunk, target=target, source=source, timeout=self._google_timeout)
+
+                if isinstance(results, list) and len(results) == len(chunk):
+                    for text, item in zip(chunk, results):
+                        if hasattr(item, 'translatedText') and item.translatedText:
+                            translated.append(item.translatedText)
+                        else:
+                            # 翻译失败，使用原文
+                            translated.append(text)
+                else:
+                    # 本组失败只影响本组，其余分组照常翻译
+                    self.logger.error(f"Google 翻译返回格式异常: {type(results)}")
+                    translated.extend(chunk)
+            return translated
+
         except Exception as e:
             self.logger.error(f"Google 批量翻译失败: {e}")
             # 标记 Google 连接失败，后续自动使用 Bing
             self._google_failed = True
-            return texts
+            # 保留已完成的分组；一组都未完成时原样返回，由调用方整体切换到 Bing
+            remaining = texts[len(translated):]
+            if translated and remaining and TRANSLATORS_AVAILABLE:
+                self.logger.warning(f"Google 翻译中途失败，剩余 {len(remaining)} 条改用 Bing 翻译")
+                remaining = self._translate_with_translators(remaining, target, source, max_batch_size)
+            return translated + remaining
+
+    def _chunk_google_texts(self, texts: List[str]) -> List[List[str]]:
+        """按单次请求的长度上限把文本分组，每组一次请求；超长的单条文本单独成组"""
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        length = 0
+        for text in texts:
+            if chunk and length + len(text) > self.GOOGLE_MAX_CHARS:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+            chunk.append(text)
+            length += len(text)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
     
     def _translate_with_translators(
         self,
@@ -372,26 +487,27 @@ class FastTranslator:
             except Exception as e:
                 return index, text, True, str(e)
         
-        # 使用线程池并发（过高并发容易触发风控或解析异常）
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [
-                executor.submit(translate_single, idx, text)
-                for idx, text in enumerate(texts)
-            ]
-            
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    idx, result, had_error, error_message = future.result()
-                    results[idx] = result
+        # 使用线程池并发（过高并发容易触发风控或解析异常）；线程池跨批次复用，不再每批创建
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="fast-translator")
+        futures = [
+            self._executor.submit(translate_single, idx, text)
+            for idx, text in enumerate(texts)
+        ]
+        
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                idx, result, had_error, error_message = future.result()
+                results[idx] = result
 
-                    if had_error:
-                        error_count += 1
-                        if first_error is None and error_message:
-                            first_error = error_message
-                except Exception as e:
+                if had_error:
                     error_count += 1
-                    if first_error is None:
-                        first_error = str(e)
+                    if first_error is None and error_message:
+                        first_error = error_message
+            except Exception as e:
+                error_count += 1
+                if first_error is None:
+                    first_error = str(e)
         
         # 确保所有结果都有值
         final_results = [
@@ -6,13 +6,26 @@ import json
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional
 
 from base.LogManager import LogManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = LogManager.get()
 
 
+def _load_json_file(path: Path):
+    """Parse a JSON file, using orjson when available (bytes in, no str decode pass)."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as reader:
+        return json.load(reader)
+
+
 def _build_metadata(translations: Dict[str, List[Dict]], extra: Optional[Dict] = None) -> Dict:
     total_files = len(translations)
     total_entries = sum(len(items) for items in translations.values())
@@ -54,6 +67,23 @@ def _escape_rpy_string(value: str) -> str:
 class JsonExporter:
     """Export translation entries into a structured JSON file."""
 
+    def export_to_stream(
+        self,
+        translations: Dict[str, List[Dict]],
+        writer: IO[str],
+        include_metadata: bool = True,
+    ) -> None:
+        """Serialise into an already opened text stream; errors propagate to the caller."""
+        payload = {
+            "translations": {file_path: [
+                _normalise_entry(item) for item in items
+            ] for file_path, items in translations.items()}
+        }
+        if include_metadata:
+            payload["meta"] = _build_metadata(translations)
+
+        json.dump(payload, writer, ensure_ascii=False, indent=2)
+
     def export(
         self,
         translations: Dict[str, List[Dict]],
@@ -61,18 +91,10 @@ class JsonExporter:
         include_metadata: bool = True,
     ) -> bool:
         try:
-            payload = {
-                "translations": {file_path: [
-                    _normalise_entry(item) for item in items
-                ] for file_path, items in translations.items()}
-            }
-            if include_metadata:
-                payload["meta"] = _build_metadata(translations)
-
             output = Path(output_path)
             output.parent.mkdir(parents=True, exist_ok=True)
             with output.open("w", encoding="utf-8") as writer:
-                json.dump(payload, writer, ensure_ascii=False, indent=2)
+                self.export_to_stream(translations, writer, include_metadata)
 
             logger.info(f"JSON 导出成功: {output}")
             return True
@@ -90,8 +112,7 @@ class JsonImporter:
             if not path.exists():
                 raise FileNotFoundError(f"文件不存在: {json_path}")
 
-            with path.open("r", encoding="utf-8") as reader:
-                payload = json.load(reader)
+            payload = _load_json_file(path)
 
             if isinstance(payload, dict) and "translations" in payload:
                 raw = payload.get("translations", {})
@@ -114,7 +114,8 @@ class ErrorRepairer:
         check_syntax: bool = True,
         check_indent: bool = True,
         check_quotes: bool = True,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        rpy_files: Optional[List[Path]] = None
     ) -> Dict[str, List[Dict]]:
         """
         批量检查文件夹
@@ -125,12 +126,14 @@ class ErrorRepairer:
             check_indent: 是否检查缩进
             check_quotes: 是否检查引号匹配
             encoding: 文件编码
+            rpy_files: 已扫描好的 .rpy 文件列表，为 None 时自行遍历 folder_path
 
         Returns:
             {文件路径: 错误列表}
         """
         all_errors = {}
-        rpy_files = list(Path(folder_path).rglob("*.rpy"))
+        if rpy_files is None:
+            rpy_files = list(Path(folder_path).rglob("*.rpy"))
 
         self.logger.info(f"检查 {len(rpy_files)} 个 .rpy 文件")
 